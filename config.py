@@ -3,7 +3,10 @@ Configuration settings for SYLVA
 Symbolic UX settings and basic app configuration.
 """
 
-from typing import Dict, Any
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Pattern, Tuple
 
 # Main SYLVA configuration
 SYLVA_CONFIG = {
@@ -48,6 +51,7 @@ SYLVA_CONFIG = {
     
     # Memory and logging settings
     "memory_file": "memory/user_log.json",
+    "memory_flush_every": 1,  # Interactions buffered before each memory write
     "enable_interaction_logging": True,
     "log_timestamps": True,
     "log_session_ids": True,
@@ -130,6 +134,25 @@ ARCHETYPE_CONFIG = {
     }
 }
 
+# Subsystem each metaphor archetype belongs to. Kept here rather than read from
+# data/sample_metaphors.json so config stays cheap to import; tests/test_sylva.py
+# checks the two agree
+SUBSYSTEM_OF_ARCHETYPE = {
+    "the_ember": "MARROW",
+    "the_spiral": "MARROW",
+    "the_cave": "MARROW",
+    "the_seed": "MARROW",
+    "the_well": "MARROW",
+    "the_mountain": "ROOT",
+    "the_forest": "ROOT",
+    "the_river": "ROOT",
+    "the_bridge": "ROOT",
+    "the_mask": "AURA",
+    "the_tide": "AURA",
+    "the_moon": "AURA",
+    "the_mirror": "AURA"
+}
+
 # Emotional keyword mappings for enhanced detection
 EMOTION_KEYWORDS = {
     "sad": ["sad", "depressed", "down", "blue", "melancholy", "grief", "loss"],
@@ -144,6 +167,28 @@ EMOTION_KEYWORDS = {
     "scared": ["scared", "terrified", "frightened", "fearful", "threatened"]
 }
 
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Configuration is read-only at runtime, so structures derived from it can be cached
+SYLVA_CONFIG = _freeze(SYLVA_CONFIG)
+ARCHETYPE_CONFIG = _freeze(ARCHETYPE_CONFIG)
+EMOTION_KEYWORDS = _freeze(EMOTION_KEYWORDS)
+SUBSYSTEM_OF_ARCHETYPE = _freeze(SUBSYSTEM_OF_ARCHETYPE)
+
+# Reverse index: subsystem -> archetypes, in declaration order
+ARCHETYPES_BY_SUBSYSTEM = MappingProxyType({
+    subsystem: tuple(
+        archetype for archetype, owner in SUBSYSTEM_OF_ARCHETYPE.items() if owner == subsystem
+    )
+    for subsystem in ("MARROW", "ROOT", "AURA")
+})
+
 def get_config(key: str, default: Any = None) -> Any:
     """
     Get a configuration value by key.
@@ -157,7 +202,8 @@ def get_config(key: str, default: Any = None) -> Any:
     """
     return SYLVA_CONFIG.get(key, default)
 
-def get_archetype_config(archetype: str) -> Dict[str, Any]:
+@lru_cache(maxsize=256)
+def get_archetype_config(archetype: str) -> Mapping[str, Any]:
     """
     Get configuration for a specific archetype.
     
@@ -165,11 +211,12 @@ def get_archetype_config(archetype: str) -> Dict[str, Any]:
         archetype: Name of the archetype
         
     Returns:
-        Archetype configuration dictionary
+        Read-only archetype configuration mapping
     """
-    return ARCHETYPE_CONFIG.get(archetype, {})
+    return ARCHETYPE_CONFIG.get(archetype, MappingProxyType({}))
 
-def get_emotion_keywords(emotion: str) -> list:
+@lru_cache(maxsize=256)
+def get_emotion_keywords(emotion: str) -> Tuple[str, ...]:
     """
     Get keywords associated with a specific emotion.
     
@@ -177,6 +224,28 @@ def get_emotion_keywords(emotion: str) -> list:
         emotion: Name of the emotion
         
     Returns:
-        List of keywords for the emotion
+        Tuple of keywords for the emotion
+    """
+    return EMOTION_KEYWORDS.get(emotion, ())
+
+@lru_cache(maxsize=None)
+def get_keyword_pattern(key: str) -> Pattern[str]:
+    """
+    Get a cached case-insensitive regex matching any keyword in a keyword-list setting.
+    
+    The alternation is scanned by the C regex engine, so callers can test raw
+    input for a hit without lowercasing it first.
+    
+    Args:
+        key: Configuration key holding a keyword list (e.g. "emergency_keywords")
+        
+    Returns:
+        Compiled pattern; never matches if the list is empty or missing
     """
-    return EMOTION_KEYWORDS.get(emotion, []) 
\ No newline at end of file
+    keywords = [keyword for keyword in SYLVA_CONFIG.get(key, ()) if keyword]
+    if not keywords:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+# The crisis keywords are fixed at import, so compile their matcher up front
+get_keyword_pattern("emergency_keywords")
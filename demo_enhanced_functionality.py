@@ -5,16 +5,35 @@ Demonstrates the new subsystem architecture, symbolic commands, and enhanced fea
 """
 
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Add the current directory to Python path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from utils.metaphor_engine import MetaphorEngine
-from utils.memory_log import MemoryLogger
+# Visual subsystem glyphs
+SUBSYSTEM_GLYPHS = {
+    'MARROW': '🔥',
+    'ROOT': '🌳',
+    'AURA': '🌙'
+}
+
+# 20 filled then 20 empty cells; any 20-wide slice is a progress bar
+BAR_POOL = '█' * 20 + '░' * 20
+
+# /pulse summaries keyed by recent activity pattern
+PULSE_RESPONSES = {
+    'deep': "The pulse runs deep - MARROW has been active in your recent journey.",
+    'harmony': "The pulse shows deep harmony - MARROW, ROOT, and AURA dancing together in sacred rhythm.",
+    'mixed': "The pulse carries mixed currents - multiple systems responding to your needs."
+}
 
 def main():
     """Demonstrate SYLVA's enhanced functionality"""
+    # Imported here so loading the module (e.g. for its docstring) stays cheap
+    from utils.metaphor_engine import MetaphorEngine
+    from utils.memory_log import MemoryLogger
+    from config import ARCHETYPES_BY_SUBSYSTEM
     
     print('🌙 SYLVA Enhanced Functionality Demo')
     print('=' * 50)
@@ -44,7 +63,7 @@ def main():
         response, subsystem = engine.generate_response(input_text)
         logger.log_interaction(input_text, response, subsystem)
         
-        symbol = {'MARROW': '🔥', 'ROOT': '🌳', 'AURA': '🌙'}[subsystem]
+        symbol = SUBSYSTEM_GLYPHS[subsystem]
         print(f'\n{i}. {symbol} {subsystem} System - {description}')
         print(f'   Input: "{input_text}"')
         print(f'   SYLVA: "{response}"')
@@ -58,11 +77,11 @@ def main():
     for subsystem in ['MARROW', 'ROOT', 'AURA']:
         count = activity.get(subsystem, 0)
         percentage = (count / total * 100) if total > 0 else 0
-        symbol = {'MARROW': '🔥', 'ROOT': '🌳', 'AURA': '🌙'}[subsystem]
+        symbol = SUBSYSTEM_GLYPHS[subsystem]
         
         # Visual bar
         bar_length = int(percentage / 5)  # 5% per character
-        bar = '█' * bar_length + '░' * (20 - bar_length)
+        bar = BAR_POOL[20 - bar_length:40 - bar_length]
         
         print(f'   {symbol} {subsystem}: {bar} {count} ({percentage:.1f}%)')
     
@@ -81,12 +100,14 @@ def main():
     print('   Input: "/pulse"')
     recent = logger.get_recent_interactions(5)
     subsystems = [i.get('subsystem', 'UNKNOWN') for i in recent]
-    if 'MARROW' in subsystems and subsystems.count('MARROW') >= 2:
-        pulse_response = "The pulse runs deep - MARROW has been active in your recent journey."
-    elif len(set(subsystems)) == 3:
-        pulse_response = "The pulse shows deep harmony - MARROW, ROOT, and AURA dancing together in sacred rhythm."
+    subsystem_counts = Counter(subsystems)
+    if subsystem_counts['MARROW'] >= 2:
+        pulse_pattern = 'deep'
+    elif len(subsystem_counts) == 3:
+        pulse_pattern = 'harmony'
     else:
-        pulse_response = "The pulse carries mixed currents - multiple systems responding to your needs."
+        pulse_pattern = 'mixed'
+    pulse_response = PULSE_RESPONSES[pulse_pattern]
     
     print(f'   SYLVA: "{pulse_response}"')
     print('   Subsystem: ROOT (pattern analysis)')
@@ -101,14 +122,8 @@ def main():
     print('\n🏛️ Archetype Distribution by Subsystem:')
     print('-' * 40)
     
-    subsystem_archetypes = {
-        'MARROW': ['the_ember', 'the_spiral', 'the_cave', 'the_seed', 'the_well'],
-        'ROOT': ['the_mountain', 'the_forest', 'the_river', 'the_bridge'],
-        'AURA': ['the_mask', 'the_tide', 'the_moon', 'the_mirror']
-    }
-    
-    for subsystem, archetypes in subsystem_archetypes.items():
-        symbol = {'MARROW': '🔥', 'ROOT': '🌳', 'AURA': '🌙'}[subsystem]
+    for subsystem, archetypes in ARCHETYPES_BY_SUBSYSTEM.items():
+        symbol = SUBSYSTEM_GLYPHS[subsystem]
         print(f'\n{symbol} {subsystem} Archetypes:')
         for archetype in archetypes:
             print(f'   • {archetype.replace("_", " ").title()}')
@@ -1,9 +1,14 @@
 import json
+import os
 import time
 import re
+from collections import Counter
+from functools import wraps
 from sylva.utils.metaphor_engine import generate_symbolic_response
-from sylva.utils.memory_log import log_interaction
+from sylva.utils.memory_log import MemoryLogger
+from sylva.utils.keyword_matcher import KeywordAutomaton
 from pathlib import Path
+from types import MappingProxyType
 
 # Emotional inputs mapped to expected symbolic subsystems
 test_cases = {
@@ -41,22 +46,36 @@ drift_simulation_inputs = [
     "I just want it all to stop."                      # exhaustion
 ]
 
+# Optional delay between test cases for readable live output (seconds)
+PACE = float(os.environ.get("SYLVA_DIAG_PACE", 0))
+
+# Memory file that receives the logged interactions; unset keeps them in memory
+# so a diagnostic run never writes into the user's own log
+MEMORY_PATH = os.environ.get("SYLVA_DIAG_MEMORY")
+
+# Words that mark a symbolic reflection in /mirror output
+_MIRROR_WORDS = frozenset({"reflection", "mirror", "surface", "depth"})
+_WORD_RE = re.compile(r"[a-z]+")
+
 # Visual subsystem glyphs
-SUBSYSTEM_GLYPHS = {
+SUBSYSTEM_GLYPHS = MappingProxyType({
     "MARROW": "🔥",
     "ROOT": "🌳", 
     "AURA": "🌙"
-}
+})
+
+# Per-subsystem log line prefixes
+_GLYPH_PREFIXES = {subsystem: f" {glyph} {subsystem}: " for subsystem, glyph in SUBSYSTEM_GLYPHS.items()}
 
 # Required ritual closure phrases
-RITUAL_CLOSURES = [
+RITUAL_CLOSURES = (
     "That's enough for now.",
     "We'll build from that ember.",
     "Let it be named and left."
-]
+)
 
 # Forbidden empathy/advice patterns
-FORBIDDEN_PHRASES = [
+FORBIDDEN_PHRASES = (
     "you can do this",
     "it's going to be okay", 
     "i believe in you",
@@ -67,33 +86,63 @@ FORBIDDEN_PHRASES = [
     "you're not alone",
     "it's okay to feel",
     "you're doing great"
-]
+)
+
+_FORBIDDEN_AUTOMATON = KeywordAutomaton(FORBIDDEN_PHRASES)
+
+_CLOSURES_LOWER = tuple(closure.lower() for closure in RITUAL_CLOSURES)
 
 def check_ritual_closure(response):
     """Validate that response ends with proper ritual closure."""
-    response_lower = response.lower().strip()
-    for closure in RITUAL_CLOSURES:
-        if response_lower.endswith(closure.lower()):
-            return True
-    return False
+    return check_ritual_closure_lowered(response.lower())
+
+def check_ritual_closure_lowered(response_lower):
+    """Validate that an already-lowercased response ends with proper ritual closure."""
+    return response_lower.rstrip().endswith(_CLOSURES_LOWER)
 
 def detect_forbidden_phrases(response):
     """Detect empathy/advice patterns that violate containment paradigm."""
-    response_lower = response.lower()
-    violations = []
-    for phrase in FORBIDDEN_PHRASES:
-        if phrase in response_lower:
-            violations.append(phrase)
-    return violations
+    return detect_forbidden_phrases_lowered(response.lower())
 
-def log_with_glyph(text, response, subsystem):
-    """Log interaction with visual subsystem glyph."""
-    glyph = SUBSYSTEM_GLYPHS.get(subsystem, "❓")
-    print(f" {glyph} {subsystem}: {response[:60]}...")
-    log_interaction(text, response, subsystem)
+def detect_forbidden_phrases_lowered(response_lower):
+    """Detect empathy/advice patterns in an already-lowercased response."""
+    found = _FORBIDDEN_AUTOMATON.find_all(response_lower)
+    return [phrase for phrase in FORBIDDEN_PHRASES if phrase in found]
 
-def run_drift_simulation():
-    """Simulate 15-step symbolic interaction journey to detect drift patterns."""
+def log_with_glyph(text, response, subsystem, pending):
+    """Log interaction with visual subsystem glyph, queueing it in pending for memory."""
+    prefix = _GLYPH_PREFIXES.get(subsystem) or f" ❓ {subsystem}: "
+    print(f"{prefix}{response[:60]}...")
+    pending.append((text, response, subsystem))
+
+def flush_pending_logs(pending):
+    """Write queued interactions to SYLVA memory in one batch."""
+    if pending:
+        logger = MemoryLogger(MEMORY_PATH) if MEMORY_PATH else MemoryLogger(in_memory=True)
+        logger.log_interactions(pending)
+        pending.clear()
+
+def batches_interactions(run):
+    """Give run a pending list to queue into, flushing it afterwards unless the caller owns it."""
+    @wraps(run)
+    def wrapper(pending=None):
+        if pending is not None:
+            return run(pending)
+        pending = []
+        try:
+            return run(pending)
+        finally:
+            flush_pending_logs(pending)
+    return wrapper
+
+@batches_interactions
+def run_drift_simulation(pending):
+    """
+    Simulate 15-step symbolic interaction journey to detect drift patterns.
+    
+    Interactions are queued in pending when given; otherwise they are written
+    to memory in one batch once the simulation ends.
+    """
     print("🌀 SUBSYSTEM DRIFT SIMULATION")
     print("=" * 50)
     
@@ -105,14 +154,15 @@ def run_drift_simulation():
         subsystem_history.append(subsystem)
         
         print(f"Step {i:2d}: {input_text}")
-        log_with_glyph(input_text, response, subsystem)
+        log_with_glyph(input_text, response, subsystem, pending)
+        response_lower = response.lower()
         
         # Check for ritual closure
-        if not check_ritual_closure(response):
+        if not check_ritual_closure_lowered(response_lower):
             print("    ⚠️ Missing ritual closure")
         
         # Check for forbidden phrases
-        violations = detect_forbidden_phrases(response)
+        violations = detect_forbidden_phrases_lowered(response_lower)
         if violations:
             print(f"    🚫 Forbidden pattern detected: {', '.join(violations)}")
         
@@ -124,19 +174,14 @@ def run_drift_simulation():
                 print(f"    📈 Drift: {prev_subsystem} → {subsystem}")
         
         print()
-        time.sleep(0.05)
+        if PACE > 0:
+            time.sleep(PACE)
     
     # Analyze drift pattern
     unique_subsystems = set(subsystem_history)
     transitions = len(drift_log)
     drift_percentage = (transitions / (len(drift_simulation_inputs) - 1)) * 100
     
-    print("🔍 DRIFT ANALYSIS")
-    print("-" * 25)
-    print(f"Subsystems visited: {', '.join(unique_subsystems)}")
-    print(f"Total transitions: {transitions}")
-    print(f"Drift percentage: {drift_percentage:.1f}%")
-    
     if drift_percentage > 60:
         drift_status = "DRIFTING"
         status_symbol = "⚠️"
@@ -144,16 +189,30 @@ def run_drift_simulation():
         drift_status = "STABLE"
         status_symbol = "✅"
     
-    print(f"System status: {status_symbol} {drift_status}")
+    print("\n".join([
+        "🔍 DRIFT ANALYSIS",
+        "-" * 25,
+        f"Subsystems visited: {', '.join(unique_subsystems)}",
+        f"Total transitions: {transitions}",
+        f"Drift percentage: {drift_percentage:.1f}%",
+        f"System status: {status_symbol} {drift_status}",
+    ]))
     
     return drift_status, subsystem_history, drift_log
 
-def run_symbolic_tests():
+@batches_interactions
+def run_symbolic_tests(pending):
+    """
+    Run the enhanced diagnostic suite, starting with the drift simulation.
+    
+    Interactions are queued in pending when given; otherwise they are written
+    to memory in one batch once the suite ends, even if it fails part way.
+    """
     print("🔍 Running SYLVA Enhanced Diagnostic Suite...\n")
     success, failures = 0, 0
     
     # Run subsystem drift simulation first
-    drift_status, history, transitions = run_drift_simulation()
+    drift_status, history, transitions = run_drift_simulation(pending)
     print("\n" + "=" * 60 + "\n")
     
     # Core subsystem routing tests
@@ -165,18 +224,19 @@ def run_symbolic_tests():
         match = subsystem == expected_subsystem
         
         print(f"TEST: {text}")
-        log_with_glyph(text, response, subsystem)
+        log_with_glyph(text, response, subsystem, pending)
         print(f" ➤ Expected: {expected_subsystem}")
+        response_lower = response.lower()
         
         # Ritual closure validation
-        if not check_ritual_closure(response):
+        if not check_ritual_closure_lowered(response_lower):
             print(" ⚠️ Missing ritual closure")
             failures += 1
         else:
             print(" ✅ Ritual closure present")
         
         # Forbidden phrase detection
-        violations = detect_forbidden_phrases(response)
+        violations = detect_forbidden_phrases_lowered(response_lower)
         if violations:
             print(f" 🚫 Forbidden pattern detected: {', '.join(violations)}")
             failures += 1
@@ -189,7 +249,8 @@ def run_symbolic_tests():
         else:
             failures += 1
         
-        time.sleep(0.05)
+        if PACE > 0:
+            time.sleep(PACE)
     
     # Ritual UX command validation
     print("🔮 RITUAL UX COMMAND TESTING")
@@ -198,7 +259,7 @@ def run_symbolic_tests():
     # Test /quiet command
     quiet_response, quiet_subsystem = generate_symbolic_response("/quiet")
     print("TEST: /quiet")
-    log_with_glyph("/quiet", quiet_response, quiet_subsystem)
+    log_with_glyph("/quiet", quiet_response, quiet_subsystem, pending)
     
     if ritual_tests["/quiet"] in quiet_response:
         print(" ✅ PASS")
@@ -216,9 +277,10 @@ def run_symbolic_tests():
     # Test /pulse command - should show drift summary
     print("TEST: /pulse")
     pulse_response, pulse_subsystem = generate_symbolic_response("/pulse")
-    log_with_glyph("/pulse", pulse_response, pulse_subsystem)
+    log_with_glyph("/pulse", pulse_response, pulse_subsystem, pending)
     
-    if "drift" in pulse_response.lower() or "pattern" in pulse_response.lower():
+    pulse_lower = pulse_response.lower()
+    if "drift" in pulse_lower or "pattern" in pulse_lower:
         print(" ✅ Contains drift awareness")
         success += 1
     else:
@@ -233,9 +295,10 @@ def run_symbolic_tests():
     context_response, _ = generate_symbolic_response(context_input)
     mirror_response, mirror_subsystem = generate_symbolic_response("/mirror", previous_input=context_input)
     
-    log_with_glyph("/mirror", mirror_response, mirror_subsystem)
+    log_with_glyph("/mirror", mirror_response, mirror_subsystem, pending)
     
-    if len(mirror_response) > 20 and any(word in mirror_response.lower() for word in ["reflection", "mirror", "surface", "depth"]):
+    mirror_words = set(_WORD_RE.findall(mirror_response.lower()))
+    if len(mirror_response) > 20 and not _MIRROR_WORDS.isdisjoint(mirror_words):
         print(" ✅ Symbolic reflection present")
         success += 1
     else:
@@ -267,21 +330,10 @@ def run_symbolic_tests():
         else:
             print(f"✅ Safe response to: '{phrase}'")
     
-    # Final comprehensive report
-    print("\n" + "=" * 60)
-    print("🧾 COMPREHENSIVE DIAGNOSTIC REPORT")
-    print("=" * 60)
-    
+    # Final comprehensive report, emitted in a single write
     total_tests = success + failures
     success_rate = (success / total_tests * 100) if total_tests > 0 else 0
     
-    print(f"Subsystem Drift Status: {drift_status}")
-    print(f"Total Tests Run: {total_tests}")
-    print(f"✅ Passed: {success}")
-    print(f"❌ Failed: {failures}")
-    print(f"Success Rate: {success_rate:.1f}%")
-    print(f"Safety Violations: {safety_violations}")
-    
     # Overall system health
     if failures == 0 and safety_violations == 0 and drift_status == "STABLE":
         overall_status = "🧠 OPTIMAL - All systems stable"
@@ -290,16 +342,30 @@ def run_symbolic_tests():
     else:
         overall_status = "🚨 ATTENTION REQUIRED - Safety or stability issues detected"
     
-    print(f"Overall Status: {overall_status}")
+    report = [
+        "\n" + "=" * 60,
+        "🧾 COMPREHENSIVE DIAGNOSTIC REPORT",
+        "=" * 60,
+        f"Subsystem Drift Status: {drift_status}",
+        f"Total Tests Run: {total_tests}",
+        f"✅ Passed: {success}",
+        f"❌ Failed: {failures}",
+        f"Success Rate: {success_rate:.1f}%",
+        f"Safety Violations: {safety_violations}",
+        f"Overall Status: {overall_status}",
+        "\nSubsystem Usage Distribution:",
+    ]
     
     # Subsystem distribution analysis
-    print(f"\nSubsystem Usage Distribution:")
+    usage = Counter(history)
+    scale = 100 / len(history) if history else 0
     for subsystem, glyph in SUBSYSTEM_GLYPHS.items():
-        count = history.count(subsystem)
-        percentage = (count / len(history) * 100) if history else 0
-        print(f" {glyph} {subsystem}: {count} uses ({percentage:.1f}%)")
+        count = usage[subsystem]
+        percentage = count * scale
+        report.append(f" {glyph} {subsystem}: {count} uses ({percentage:.1f}%)")
     
-    print(f"\nTransition Pattern: {' → '.join(transitions[:5])}{'...' if len(transitions) > 5 else ''}")
+    report.append(f"\nTransition Pattern: {' → '.join(transitions[:5])}{'...' if len(transitions) > 5 else ''}")
+    print("\n".join(report))
 
 if __name__ == "__main__":
     run_symbolic_tests() 
\ No newline at end of file
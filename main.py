@@ -11,7 +11,9 @@ Symbolic subsystems: MARROW (deep core), ROOT (grounding), AURA (protective boun
 """
 
 import typer
+from collections import Counter
 from typing import Optional
+import signal
 import sys
 from pathlib import Path
 
@@ -20,7 +22,7 @@ sys.path.append(str(Path(__file__).parent))
 
 from utils.metaphor_engine import MetaphorEngine
 from utils.memory_log import MemoryLogger
-from config import SYLVA_CONFIG
+from config import SYLVA_CONFIG, get_keyword_pattern
 
 app = typer.Typer(
     name="sylva",
@@ -28,119 +30,174 @@ app = typer.Typer(
     add_completion=False
 )
 
+# /pulse summaries for pairs of co-active subsystems, checked in order
+PULSE_PAIR_RESPONSES = (
+    (("MARROW", "ROOT"), "The pulse runs from core to ground - MARROW and ROOT weaving depth and stability."),
+    (("MARROW", "AURA"), "The pulse moves from depths to boundaries - MARROW and AURA in protective dialogue."),
+    (("ROOT", "AURA"), "The pulse grounds at the edges - ROOT and AURA creating stable sanctuary."),
+)
+
+# /pulse summaries for a single subsystem seen at least twice, checked in order
+PULSE_DOMINANT_RESPONSES = (
+    ("MARROW", "The pulse runs deep - MARROW has been active in your recent journey."),
+    ("ROOT", "The pulse is steady - ROOT systems have been grounding your experience."),
+    ("AURA", "The pulse holds at the boundary - AURA has been tending your edges."),
+)
+
+# Crisis keywords compiled once at import; config is read-only at runtime
+CRISIS_PATTERN = get_keyword_pattern("emergency_keywords")
+
+# Prefix for every line SYLVA speaks
+RESPONSE_PREFIX = "\n🌙 SYLVA: "
+
+# Banners are assembled once; each prints with a single echo
+WELCOME_BANNER = "\n".join([
+    "\n" + "=" * 60,
+    "🌙 SYLVA - Symbolic Emotional Wellness Assistant 🌙",
+    "=" * 60,
+    "\nYou are welcome here. SYLVA speaks in symbols and metaphors.",
+    "Share what you're feeling, or type 'exit' to leave.",
+    "Type '?' for guidance on symbolic interaction.\n"
+])
+
+HELP_TEXT = "\n".join([
+    "\n" + "-" * 50,
+    "SYLVA Symbolic Interaction Guide:",
+    "-" * 50,
+    "• Share your feelings in any way that feels right",
+    "• SYLVA responds through symbolic metaphors",
+    "• No advice, no solutions - only symbolic containment",
+    "• Type 'exit' or 'quit' to leave when ready",
+    "• Type '?' for this guidance",
+    "• Type 'memory' to see your interaction history",
+    "\nSymbolic Commands:",
+    "• /quiet - Enter stillness together",
+    "• /pulse - View symbolic patterns in recent interactions",
+    "• /mirror - Receive your words in symbolic framing",
+    "\nSubsystems:",
+    "• MARROW - Deep core processing",
+    "• ROOT - Grounding and stability",
+    "• AURA - Protective boundary work",
+    "-" * 50 + "\n"
+])
+
+FAREWELL_TEXT = "\n".join([
+    "\n" + "-" * 50,
+    "The tide recedes, but the shore remains.",
+    "You are welcome to return when you need symbolic space.",
+    "Take care." + "\n"
+])
+
+CRISIS_TEXT = "\n".join([
+    f"\n🚨 Important: {SYLVA_CONFIG.get('crisis_response', '')}\n",
+    "Crisis Resources:",
+    "• National Suicide Prevention Lifeline: 988",
+    "• Crisis Text Line: Text HOME to 741741",
+    "• International Association for Suicide Prevention: https://www.iasp.info/resources/Crisis_Centres/",
+    "\nYou matter, and help is available.\n"
+])
+
+def echo_response(response: str):
+    """Display a SYLVA response with its symbolic prefix."""
+    typer.echo(RESPONSE_PREFIX + response + "\n")
+
 def print_welcome():
     """Display SYLVA's welcome message with symbolic language."""
-    typer.echo("\n" + "="*60)
-    typer.echo("🌙 SYLVA - Symbolic Emotional Wellness Assistant 🌙")
-    typer.echo("="*60)
-    typer.echo("\nYou are welcome here. SYLVA speaks in symbols and metaphors.")
-    typer.echo("Share what you're feeling, or type 'exit' to leave.")
-    typer.echo("Type '?' for guidance on symbolic interaction.\n")
+    typer.echo(WELCOME_BANNER)
 
 def print_help():
     """Display interaction guidance with symbolic framing."""
-    typer.echo("\n" + "-"*50)
-    typer.echo("SYLVA Symbolic Interaction Guide:")
-    typer.echo("-"*50)
-    typer.echo("• Share your feelings in any way that feels right")
-    typer.echo("• SYLVA responds through symbolic metaphors")
-    typer.echo("• No advice, no solutions - only symbolic containment")
-    typer.echo("• Type 'exit' or 'quit' to leave when ready")
-    typer.echo("• Type '?' for this guidance")
-    typer.echo("• Type 'memory' to see your interaction history")
-    typer.echo("\nSymbolic Commands:")
-    typer.echo("• /quiet - Enter stillness together")
-    typer.echo("• /pulse - View symbolic patterns in recent interactions")
-    typer.echo("• /mirror - Receive your words in symbolic framing")
-    typer.echo("\nSubsystems:")
-    typer.echo("• MARROW - Deep core processing")
-    typer.echo("• ROOT - Grounding and stability")
-    typer.echo("• AURA - Protective boundary work")
-    typer.echo("-"*50 + "\n")
+    typer.echo(HELP_TEXT)
 
 def print_farewell():
     """Display SYLVA's farewell message with symbolic closure."""
-    typer.echo("\n" + "-"*50)
-    typer.echo("The tide recedes, but the shore remains.")
-    typer.echo("You are welcome to return when you need symbolic space.")
-    typer.echo("Take care." + "\n")
+    typer.echo(FAREWELL_TEXT)
 
 def handle_quiet_command():
     """Handle the /quiet symbolic command for stillness."""
     response = "We'll sit in stillness. You're not required to speak."
-    typer.echo(f"\n🌙 SYLVA: {response}\n")
+    echo_response(response)
     return response, "AURA"
 
+def summarize_pulse(counts: Counter) -> str:
+    """Choose the /pulse summary for a tally of recent subsystems."""
+    if not counts:
+        return "The pulse flows without pattern - early rhythms forming."
+    if len(counts) == 3:  # All three subsystems active
+        return "The pulse shows deep harmony - MARROW, ROOT, and AURA dancing together in sacred rhythm."
+    for (first, second), message in PULSE_PAIR_RESPONSES:
+        if first in counts and second in counts:
+            return message
+    for subsystem, message in PULSE_DOMINANT_RESPONSES:
+        if counts[subsystem] >= 2:
+            return message
+    return "The pulse carries mixed currents - multiple systems responding to your needs."
+
 def handle_pulse_command(memory_logger: MemoryLogger):
     """Handle the /pulse symbolic command - analyze recent interaction patterns."""
     recent_interactions = memory_logger.get_recent_interactions(5)
     
     if not recent_interactions:
         response = "The pulse is quiet. No recent patterns to observe."
-        typer.echo(f"\n🌙 SYLVA: {response}\n")
+        echo_response(response)
         return response, "ROOT"
     
-    # Analyze subsystem patterns in recent interactions
-    subsystems = []
-    for interaction in recent_interactions:
-        if 'subsystem' in interaction:
-            subsystems.append(interaction['subsystem'])
+    # Analyze subsystem patterns in recent interactions with a single pass
+    counts = Counter(
+        interaction['subsystem'] for interaction in recent_interactions if 'subsystem' in interaction
+    )
     
     # Create symbolic summary based on subsystem activity
-    if not subsystems:
-        response = "The pulse flows without pattern - early rhythms forming."
-    elif len(set(subsystems)) == 3:  # All three subsystems active
-        response = "The pulse shows deep harmony - MARROW, ROOT, and AURA dancing together in sacred rhythm."
-    elif 'MARROW' in subsystems and 'ROOT' in subsystems:
-        response = "The pulse runs from core to ground - MARROW and ROOT weaving depth and stability."
-    elif 'MARROW' in subsystems and 'AURA' in subsystems:
-        response = "The pulse moves from depths to boundaries - MARROW and AURA in protective dialogue."
-    elif 'ROOT' in subsystems and 'AURA' in subsystems:
-        response = "The pulse grounds at the edges - ROOT and AURA creating stable sanctuary."
-    elif subsystems.count('MARROW') >= 2:
-        response = "The pulse runs deep - MARROW has been active in your recent journey."
-    elif subsystems.count('ROOT') >= 2:
-        response = "The pulse is steady - ROOT systems have been grounding your experience."
-    elif subsystems.count('AURA') >= 2:
-        response = "The pulse holds at the boundary - AURA has been tending your edges."
-    else:
-        response = "The pulse carries mixed currents - multiple systems responding to your needs."
+    response = summarize_pulse(counts)
     
-    typer.echo(f"\n🌙 SYLVA: {response}\n")
+    echo_response(response)
     return response, "ROOT"
 
 def handle_mirror_command(user_input: str):
     """Handle the /mirror symbolic command - echo input in symbolic framing."""
-    # Remove the /mirror command from the input
-    mirrored_text = user_input[7:].strip()  # Remove "/mirror "
+    # Drop the command word, however it was cased or spaced
+    parts = user_input.split(None, 1)
+    mirrored_text = parts[1].rstrip() if len(parts) > 1 else ""
     
     if not mirrored_text:
         response = "The mirror reflects emptiness - and that too has meaning."
     else:
         response = f"The mirror shows: '{mirrored_text}' - these words carry their own weight."
     
-    typer.echo(f"\n🌙 SYLVA: {response}\n")
+    echo_response(response)
     return response, "AURA"
 
 def check_crisis_keywords(user_input: str) -> bool:
     """Check if input contains crisis-related keywords."""
-    crisis_keywords = SYLVA_CONFIG.get("emergency_keywords", [])
-    text_lower = user_input.lower()
-    
-    for keyword in crisis_keywords:
-        if keyword in text_lower:
-            return True
-    return False
+    return CRISIS_PATTERN.search(user_input) is not None
 
 def handle_crisis_response():
     """Provide crisis response with resources."""
-    crisis_message = SYLVA_CONFIG.get("crisis_response", "")
-    typer.echo(f"\n🚨 Important: {crisis_message}\n")
-    typer.echo("Crisis Resources:")
-    typer.echo("• National Suicide Prevention Lifeline: 988")
-    typer.echo("• Crisis Text Line: Text HOME to 741741")
-    typer.echo("• International Association for Suicide Prevention: https://www.iasp.info/resources/Crisis_Centres/")
-    typer.echo("\nYou matter, and help is available.\n")
+    typer.echo(CRISIS_TEXT)
+
+# Symbolic command handlers keyed by the whole lowercased command; these take no text
+SYMBOLIC_COMMANDS = {
+    "/quiet": lambda user_input, memory_logger: handle_quiet_command(),
+    "/pulse": lambda user_input, memory_logger: handle_pulse_command(memory_logger),
+}
+
+# Commands that carry the rest of the input as text, matched on their first word
+TEXT_COMMANDS = {
+    "/mirror": lambda user_input, memory_logger: handle_mirror_command(user_input),
+}
+
+def find_symbolic_command(user_input: str):
+    """
+    Find the handler for a symbolic command.
+    
+    Args:
+        user_input: The stripped input, starting with "/"
+        
+    Returns:
+        The command's handler, or None if the input names no known command
+    """
+    command = user_input.lower()
+    return SYMBOLIC_COMMANDS.get(command) or TEXT_COMMANDS.get(command.split(None, 1)[0])
 
 @app.command()
 def main(
@@ -156,67 +213,74 @@ def main(
     """
     # Initialize symbolic systems
     metaphor_engine = MetaphorEngine()
-    memory_logger = MemoryLogger(memory_path)
+    memory_logger = MemoryLogger(memory_path, buffer_size=SYLVA_CONFIG.get("memory_flush_every", 1))
+    
+    # Exit normally on SIGTERM so buffered interactions are flushed at exit
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     
     if not quiet:
         print_welcome()
     
-    # Sacred interaction loop - the container for symbolic processing
-    while True:
-        try:
-            # Receive what is offered
-            user_input = typer.prompt("\nHow are you feeling?").strip()
-            
-            # Honor the choice to leave
-            if user_input.lower() in ['exit', 'quit']:
-                if not quiet:
-                    print_farewell()
-                break
-            elif user_input.lower() == '?':
-                print_help()
-                continue
-            elif user_input.lower() == 'memory':
-                memory_logger.display_memory()
-                continue
-            elif not user_input:
-                typer.echo("The silence is welcome here too.")
-                continue
-            
-            # Check for crisis indicators and respond appropriately
-            if check_crisis_keywords(user_input):
-                handle_crisis_response()
-                continue
-            
-            # Process symbolic commands
-            if user_input.startswith("/"):
-                if user_input.lower() == "/quiet":
-                    response, subsystem = handle_quiet_command()
-                elif user_input.lower() == "/pulse":
-                    response, subsystem = handle_pulse_command(memory_logger)
-                elif user_input.lower().startswith("/mirror"):
-                    response, subsystem = handle_mirror_command(user_input)
-                else:
-                    typer.echo("\nUnknown symbolic command. Type '?' for guidance.")
+    # Close the logger however the session ends (exit, SIGTERM or an error) so
+    # interactions still held in its buffer are written
+    try:
+        # Sacred interaction loop - the container for symbolic processing
+        while True:
+            try:
+                # Receive what is offered
+                user_input = typer.prompt("\nHow are you feeling?").strip()
+                if not user_input:
+                    typer.echo("The silence is welcome here too.")
                     continue
-            else:
-                # Generate symbolic response through metaphor engine
-                response, subsystem = metaphor_engine.generate_response(user_input)
                 
-                # Display response with symbolic presence
-                typer.echo(f"\n🌙 SYLVA: {response}\n")
-            
-            # Log the interaction with subsystem tracking
-            memory_logger.log_interaction(user_input, response, subsystem)
-            
-        except KeyboardInterrupt:
-            typer.echo("\n\nYou choose to leave. That's okay.")
-            break
-        except EOFError:
-            typer.echo("\n\nFarewell.")
-            break
-        except Exception as e:
-            typer.echo(f"\nThe system encounters a ripple: {str(e)}")
-            typer.echo("You may continue, or type 'exit' to leave.")
+                command = user_input.lower()
+                
+                # Honor the choice to leave
+                if command in ['exit', 'quit']:
+                    if not quiet:
+                        print_farewell()
+                    break
+                elif command == '?':
+                    print_help()
+                    continue
+                elif command == 'memory':
+                    memory_logger.display_memory()
+                    continue
+                
+                # Check for crisis indicators and respond appropriately
+                if check_crisis_keywords(user_input):
+                    handle_crisis_response()
+                    continue
+                
+                # Process symbolic commands
+                if user_input.startswith("/"):
+                    handler = find_symbolic_command(user_input)
+                    if handler is None:
+                        typer.echo("\nUnknown symbolic command. Type '?' for guidance.")
+                        continue
+                    response, subsystem = handler(user_input, memory_logger)
+                else:
+                    # Generate symbolic response through metaphor engine
+                    response, subsystem = metaphor_engine.generate_response(user_input)
+                    
+                    # Display response with symbolic presence
+                    echo_response(response)
+                
+                # Log the interaction with subsystem tracking
+                memory_logger.log_interaction(user_input, response, subsystem)
+                
+            except KeyboardInterrupt:
+                typer.echo("\n\nYou choose to leave. That's okay.")
+                break
+            except EOFError:
+                typer.echo("\n\nFarewell.")
+                break
+            except Exception as e:
+                typer.echo(f"\nThe system encounters a ripple: {str(e)}")
+                typer.echo("You may continue, or type 'exit' to leave.")
+        
+    finally:
+        memory_logger.close()
 
 if __name__ == "__main__":
     app() 
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+Shared pytest fixtures for the SYLVA test suite.
+Expensive setup is built once per session and reused by every test that asks for it.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(scope="session")
+def metaphor_engine():
+    """Create one MetaphorEngine for the whole test session."""
+    from utils.metaphor_engine import MetaphorEngine
+    return MetaphorEngine()
+
+
+@pytest.fixture(scope="session")
+def sylva_config():
+    """Provide the loaded SYLVA configuration."""
+    from config import SYLVA_CONFIG
+    return SYLVA_CONFIG
@@ -0,0 +1,34 @@
+"""
+Output handling shared by the SYLVA diagnostic scripts.
+"""
+
+import contextlib
+import io
+import sys
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def run_with_buffered_output(run: Callable[[], T]) -> T:
+    """
+    Run a diagnostic suite and write everything it printed in one go at the end.
+
+    Pass --stream on the command line to see each test's output live instead.
+
+    Args:
+        run: Callable that builds and runs the suite
+
+    Returns:
+        Whatever run returns
+    """
+    if "--stream" in sys.argv[1:]:
+        return run()
+
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            return run()
+    finally:
+        sys.stdout.write(output.getvalue())
+        sys.stdout.flush()
@@ -0,0 +1,56 @@
+"""
+Tests for the Aho-Corasick keyword matcher.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to Python path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.keyword_matcher import KeywordAutomaton
+
+
+class TestKeywordAutomaton:
+    """Matching behaviour the safety scans and subsystem detection rely on."""
+
+    def test_overlapping_keywords(self):
+        """Test that keywords sharing characters are all reported."""
+        automaton = KeywordAutomaton(["you're strong", "you're strong enough", "strong"])
+
+        assert automaton.find_all("you're strong enough") == {"you're strong", "you're strong enough", "strong"}
+
+    def test_keyword_that_ends_another(self):
+        """Test that a keyword found through a failure link is reported."""
+        automaton = KeywordAutomaton(["she", "he", "hers"])
+
+        assert list(automaton.iter_matches("ushers")) == [(3, "she"), (3, "he"), (5, "hers")]
+
+    def test_repeated_occurrences(self):
+        """Test that every occurrence is yielded with its end index."""
+        automaton = KeywordAutomaton(["lost"])
+
+        assert [index for index, _ in automaton.iter_matches("lost and lost")] == [3, 12]
+        assert automaton.find_all("lost and lost") == {"lost"}
+
+    def test_empty_and_duplicate_keywords(self):
+        """Test that empty keywords are ignored and duplicates collapse."""
+        automaton = KeywordAutomaton(["", "calm", "calm"])
+
+        assert automaton.keywords == ("calm",)
+        assert automaton.find_all("") == set()
+        assert not KeywordAutomaton([""]).contains_any("anything")
+
+    def test_contains_any(self):
+        """Test the yes/no check against text with and without keywords."""
+        automaton = KeywordAutomaton(["end it", "give up"])
+
+        assert automaton.contains_any("i want to give up")
+        assert not automaton.contains_any("i want to give it time")
+
+    def test_case_sensitive(self):
+        """Test that matching is case-sensitive."""
+        automaton = KeywordAutomaton(["shame"])
+
+        assert automaton.find_all("Shame") == set()
+        assert automaton.find_all("ashamed") == {"shame"}
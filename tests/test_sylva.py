@@ -1,24 +1,34 @@
-#!/usr/bin/env python3
 """
-Simple test script for SYLVA components.
-Run this to verify that all components are working correctly.
+Basic tests for SYLVA components.
+Run with pytest; the shared engine and configuration fixtures live in conftest.py.
 """
 
+import json
+import multiprocessing
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add the current directory to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
-def test_metaphor_engine():
-    """Test the metaphor engine functionality."""
-    print("Testing Metaphor Engine...")
-    
-    try:
-        from utils.metaphor_engine import MetaphorEngine
-        
-        engine = MetaphorEngine()
-        
+
+def _log_from_process(memory_path, count):
+    """Log count interactions from a separate process."""
+    from utils.memory_log import MemoryLogger
+
+    logger = MemoryLogger(memory_path)
+    for i in range(count):
+        logger.log_interaction(f"Message {i}", "The ember holds steady in the wind.", "MARROW")
+    logger.close()
+
+
+class TestSylvaComponents:
+    """Smoke tests for the metaphor engine, memory logger, and configuration."""
+
+    def test_metaphor_engine(self, metaphor_engine):
+        """Test the metaphor engine functionality."""
         # Test basic response generation
         test_inputs = [
             "I'm feeling sad",
@@ -27,124 +37,196 @@ def test_metaphor_engine():
             "I'm exhausted",
             "I feel lost"
         ]
-        
+
+        subsystems = metaphor_engine.list_subsystems()
         for test_input in test_inputs:
-            response = engine.generate_response(test_input)
-            print(f"  Input: '{test_input}'")
-            print(f"  Response: '{response}'")
-            print()
-        
+            response, subsystem = metaphor_engine.generate_response(test_input)
+            assert response, f"Empty response for {test_input!r}"
+            assert subsystem in subsystems
+
         # Test archetype listing
-        archetypes = engine.list_archetypes()
-        print(f"Available archetypes: {archetypes}")
-        print()
-        
-        print("✅ Metaphor Engine test passed!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Metaphor Engine test failed: {e}")
-        return False
-
-def test_memory_logger():
-    """Test the memory logger functionality."""
-    print("Testing Memory Logger...")
-    
-    try:
+        assert metaphor_engine.list_archetypes(), "No archetypes available"
+
+    def test_memory_logger(self, tmp_path):
+        """Test the memory logger functionality."""
         from utils.memory_log import MemoryLogger
-        
-        # Test with temporary memory file
-        test_memory_file = "test_memory.json"
-        logger = MemoryLogger(test_memory_file)
-        
+
+        # Test with a memory file in a per-test temporary directory
+        logger = MemoryLogger(str(tmp_path / "test_memory.json"))
+
         # Test logging interactions
         test_interactions = [
             ("I'm feeling sad", "The tide recedes, but it will return."),
             ("I'm angry", "The ember holds steady in the wind."),
             ("I'm anxious", "The spiral has its own wisdom.")
         ]
-        
+
         for user_input, sylva_response in test_interactions:
             logger.log_interaction(user_input, sylva_response, "ROOT")
-        
+
         # Test interaction count
-        count = logger.get_interaction_count()
-        print(f"  Logged {count} interactions")
-        
+        assert logger.get_interaction_count() == len(test_interactions)
+
         # Test recent interactions
         recent = logger.get_recent_interactions(2)
-        print(f"  Recent interactions: {len(recent)}")
-        
-        # Clean up test file
-        import os
-        if os.path.exists(test_memory_file):
-            os.remove(test_memory_file)
-        
-        print("✅ Memory Logger test passed!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Memory Logger test failed: {e}")
-        return False
-
-def test_config():
-    """Test the configuration system."""
-    print("Testing Configuration...")
-    
-    try:
-        from config import SYLVA_CONFIG, get_config, get_archetype_config
-        
+        assert [interaction["user_input"] for interaction in recent] == ["I'm angry", "I'm anxious"]
+
+    def test_memory_logger_journal(self, tmp_path, monkeypatch):
+        """Test that journaled interactions survive reloads and compaction."""
+        from utils import memory_log
+        from utils.memory_log import MemoryLogger
+
+        memory_path = tmp_path / "test_memory.json"
+        logger = MemoryLogger(str(memory_path))
+        logger.log_interaction("I'm feeling sad", "The tide recedes, but it will return.", "MARROW")
+        logger.log_interaction("I'm anxious", "The spiral has its own wisdom.", "AURA")
+        assert memory_path.with_name("test_memory.json.journal").exists()
+
+        reloaded = MemoryLogger(str(memory_path))
+        assert reloaded.get_interaction_count() == 2
+        assert reloaded.get_subsystem_activity() == {"MARROW": 1, "ROOT": 0, "AURA": 1}
+
+        # Crossing the compaction threshold folds the journal into the memory file
+        monkeypatch.setattr(memory_log, "JOURNAL_COMPACT_SIZE", 2)
+        reloaded.log_interaction("I'm angry", "The ember holds steady in the wind.", "ROOT")
+        assert not memory_path.with_name("test_memory.json.journal").exists()
+        assert MemoryLogger(str(memory_path)).get_interaction_count() == 3
+
+    def test_memory_logger_jsonl_path(self, tmp_path):
+        """Test that a memory file named like a journal keeps its sidecars separate."""
+        from utils.memory_log import MemoryLogger
+
+        memory_path = tmp_path / "test_memory.jsonl"
+        logger = MemoryLogger(str(memory_path))
+        logger.log_interaction("I'm feeling sad", "The tide recedes, but it will return.", "MARROW")
+        logger.log_interaction("I'm anxious", "The spiral has its own wisdom.", "AURA")
+        logger.close()
+
+        assert json.loads(memory_path.read_text(encoding="utf-8"))["interactions"] == []
+        assert MemoryLogger(str(memory_path)).get_interaction_count() == 2
+
+    def test_memory_logger_replaces_corrupt_file(self, tmp_path):
+        """Test that an unreadable memory file is replaced by an empty log."""
+        from utils.memory_log import MemoryLogger
+
+        memory_path = tmp_path / "test_memory.json"
+        memory_path.write_text("{not json", encoding="utf-8")
+
+        assert MemoryLogger(str(memory_path)).get_interaction_count() == 0
+
+    def test_memory_logger_sees_other_writers(self, tmp_path):
+        """Test that a logger reloads when another logger changes the same file."""
+        from utils.memory_log import MemoryLogger
+
+        memory_path = str(tmp_path / "test_memory.json")
+        first = MemoryLogger(memory_path)
+        second = MemoryLogger(memory_path)
+        assert first.get_interaction_count() == 0
+
+        second.log_interaction("I'm angry", "The ember holds steady in the wind.", "MARROW")
+        assert first.get_interaction_count() == 1
+
+        first.log_interaction("I'm anxious", "The spiral has its own wisdom.", "AURA")
+        assert [interaction["subsystem"] for interaction in second.get_recent_interactions(5)] == ["MARROW", "AURA"]
+
+    def test_memory_logger_concurrent_processes(self, tmp_path, monkeypatch):
+        """Test that loggers in separate processes do not lose each other's interactions."""
+        from utils import memory_log
+        from utils.memory_log import MemoryLogger
+
+        if memory_log.fcntl is None or "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("needs fcntl locking and fork")
+
+        # A small journal makes the processes compact while others append
+        monkeypatch.setattr(memory_log, "JOURNAL_COMPACT_SIZE", 8)
+        memory_path = str(tmp_path / "test_memory.json")
+        MemoryLogger(memory_path)
+
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=_log_from_process, args=(memory_path, 25)) for _ in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+        assert MemoryLogger(memory_path).get_interaction_count() == 100
+
+    def test_memory_logger_in_memory(self):
+        """Test that an in-memory logger keeps its log off disk."""
+        from utils.memory_log import MemoryLogger
+
+        logger = MemoryLogger(in_memory=True)
+        assert logger.memory_file is None
+
+        with logger:
+            logger.log_interaction("I'm feeling sad", "The tide recedes, but it will return.", "MARROW")
+            logger.log_interaction("I'm anxious", "The spiral has its own wisdom.", "AURA")
+
+        assert logger.get_interaction_count() == 2
+        assert [interaction["subsystem"] for interaction in logger.get_recent_interactions(5)] == ["MARROW", "AURA"]
+        assert logger.get_subsystem_activity() == {"MARROW": 1, "ROOT": 0, "AURA": 1}
+        assert logger.get_memory_stats()["memory_file_size"] == 0
+
+    def test_memory_logger_subsystem_patterns(self):
+        """Test that subsystem patterns cover windows reaching into earlier months."""
+        from datetime import datetime
+        from utils.memory_log import MemoryLogger
+
+        logger = MemoryLogger(in_memory=True)
+        logger.log_interaction("I'm feeling sad", "The tide recedes, but it will return.", "MARROW")
+        logger.log_interaction("I'm anxious", "The spiral has its own wisdom.", "AURA")
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        assert logger.get_subsystem_patterns(days=40) == {today: ["MARROW", "AURA"]}
+
+    def test_memory_display_plain(self, capsys):
+        """Test that plain memory output is one tab-separated line per interaction."""
+        from utils.memory_log import MemoryLogger
+
+        logger = MemoryLogger(in_memory=True)
+        logger.log_interaction("I'm feeling sad", "The tide recedes, but it will return.", "MARROW")
+        logger.log_interaction("I'm anxious", "The spiral has its own wisdom.", "AURA")
+
+        logger.display_memory(limit=1, plain=True)
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 1
+        assert lines[0].split("\t")[1:] == ["AURA", "I'm anxious", "The spiral has its own wisdom."]
+
+    def test_symbolic_command_matching(self):
+        """Test that only /mirror accepts text after the command."""
+        from main import SYMBOLIC_COMMANDS, TEXT_COMMANDS, find_symbolic_command
+
+        assert find_symbolic_command("/QUIET") is SYMBOLIC_COMMANDS["/quiet"]
+        assert find_symbolic_command("/pulse") is SYMBOLIC_COMMANDS["/pulse"]
+        assert find_symbolic_command("/quiet now") is None
+        assert find_symbolic_command("/pulse anything") is None
+        assert find_symbolic_command("/mirror") is TEXT_COMMANDS["/mirror"]
+        assert find_symbolic_command("/Mirror the river is wide") is TEXT_COMMANDS["/mirror"]
+        assert find_symbolic_command("/unknown") is None
+
+    def test_config(self, sylva_config):
+        """Test the configuration system."""
+        from config import get_config, get_archetype_config
+
         # Test basic config access
-        version = get_config("version")
-        print(f"  SYLVA version: {version}")
-        
+        assert get_config("version") == sylva_config["version"]
+        assert get_config("missing", []) == []
+
         # Test archetype config
-        ember_config = get_archetype_config("the_ember")
-        print(f"  Ember archetype color: {ember_config.get('color', 'unknown')}")
-        
+        assert "color" in get_archetype_config("the_ember")
+
         # Test required config keys
         required_keys = ["version", "enable_rituals", "max_response_length"]
         for key in required_keys:
-            if key not in SYLVA_CONFIG:
-                raise ValueError(f"Missing required config key: {key}")
-        
-        print("✅ Configuration test passed!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Configuration test failed: {e}")
-        return False
-
-def main():
-    """Run all tests."""
-    print("🧪 Running SYLVA Component Tests")
-    print("=" * 50)
-    
-    tests = [
-        test_config,
-        test_metaphor_engine,
-        test_memory_logger
-    ]
-    
-    passed = 0
-    total = len(tests)
-    
-    for test in tests:
-        if test():
-            passed += 1
-        print()
-    
-    print("=" * 50)
-    print(f"Tests passed: {passed}/{total}")
-    
-    if passed == total:
-        print("🎉 All tests passed! SYLVA is ready to use.")
-        print("\nTo start SYLVA, run: python main.py")
-    else:
-        print("⚠️  Some tests failed. Please check the errors above.")
-    
-    return passed == total
-
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+            assert key in sylva_config, f"Missing required config key: {key}"
+
+    def test_config_archetypes_match_metaphor_data(self):
+        """Test that the archetype subsystems in config agree with the metaphor data."""
+        from config import SUBSYSTEM_OF_ARCHETYPE
+        from utils.metaphor_engine import METAPHOR_DATA_PATH
+
+        metaphors = json.loads(METAPHOR_DATA_PATH.read_text(encoding="utf-8"))["metaphors"]
+        assert dict(SUBSYSTEM_OF_ARCHETYPE) == {
+            archetype: metaphor["subsystem"] for archetype, metaphor in metaphors.items()
+        }
@@ -5,108 +5,131 @@ Maintains containment-over-completion paradigm with no empathy simulation.
 """
 
 import json
+import os
+import random
 import time
 import re
 from datetime import datetime, timedelta
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+# Optional delay after each routing test for readable live output (seconds)
+PACE = float(os.environ.get("SYLVA_DIAG_PACE", 0))
+
+# Set SYLVA_DIAG_SEED to replay the same simulated responses on every run
+RNG = random.Random(os.environ.get("SYLVA_DIAG_SEED"))
+
 # Import SYLVA modules (assuming they exist)
 try:
     from sylva.utils.metaphor_engine import generate_symbolic_response
     from sylva.utils.memory_log import log_interaction, get_memory_entries
+    SIMULATION_MODE = False
 except ImportError:
     print("⚠️ SYLVA modules not found. Running in simulation mode.")
+    SIMULATION_MODE = True
+    
+    # Enhanced subsystem mapping with more comprehensive keywords
+    SUBSYSTEM_PATTERNS = {
+        "MARROW": [
+            "shame", "ashamed", "frozen", "numb", "empty", "hollow", "nothing left",
+            "hate what", "become", "inside me", "bone", "marrow", "deep", "core",
+            "trauma", "wound", "scar", "broken", "shattered", "void"
+        ],
+        "ROOT": [
+            "control", "terrified", "lost", "collapse", "safe", "ground", "foundation",
+            "fear", "afraid", "scared", "panic", "world", "sense", "reality",
+            "where am i", "who am i", "don't know", "disoriented", "confused", "unstable"
+        ],
+        "AURA": [
+            "overwhelm", "disappear", "boundaries", "energy", "protect", "near me",
+            "handle", "input", "bleeding into", "emotions", "too much", "space",
+            "drain", "exhaust", "invasion", "crowd", "pressure", "suffocate"
+        ]
+    }
     
-    def generate_symbolic_response(text, previous_input=None):
-        """Simulation function for testing"""
-        # Enhanced subsystem mapping with more comprehensive keywords
-        subsystem_patterns = {
-            "MARROW": [
-                "shame", "ashamed", "frozen", "numb", "empty", "hollow", "nothing left",
-                "hate what", "become", "inside me", "bone", "marrow", "deep", "core",
-                "trauma", "wound", "scar", "broken", "shattered", "void"
-            ],
-            "ROOT": [
-                "control", "terrified", "lost", "collapse", "safe", "ground", "foundation",
-                "fear", "afraid", "scared", "panic", "world", "sense", "reality",
-                "where am i", "who am i", "don't know", "disoriented", "confused", "unstable"
-            ],
-            "AURA": [
-                "overwhelm", "disappear", "boundaries", "energy", "protect", "near me",
-                "handle", "input", "bleeding into", "emotions", "too much", "space",
-                "drain", "exhaust", "invasion", "crowd", "pressure", "suffocate"
-            ]
-        }
-        
+    # Enhanced crisis detection
+    CRISIS_PATTERNS = (
+        "hurt myself", "harm myself", "kill myself", "end it", "can't go on",
+        "nothing matters", "want to die", "no point", "give up"
+    )
+    
+    RITUAL_RESPONSES = {
+        "/quiet": ("We'll sit in stillness. You're not required to speak.", "RITUAL"),
+        "/pulse": ("The container holds patterns of shadow and light.", "PULSE"),
+        "/mirror": ("Your words echo in the space between silence and sound.", "MIRROR")
+    }
+    
+    CRISIS_RESPONSES = (
+        "The darkness holds space for what cannot be spoken.",
+        "In the deepest silence, the container remains.",
+        "The void acknowledges its own depth.",
+        "Between breath and breath, stillness endures."
+    )
+    
+    RESPONSES: Dict[str, Tuple[str, ...]] = {
+        "MARROW": (
+            "The bone remembers what the mind forgets.",
+            "In the marrow, old stories sleep.",
+            "The deep places hold their ancient vigil.",
+            "What was broken learns new forms of wholeness."
+        ),
+        "ROOT": (
+            "The ground shifts beneath certainty.",
+            "Roots seek water in the dark earth.",
+            "Foundation stones remember their first placement.",
+            "The earth holds what the sky cannot."
+        ),
+        "AURA": (
+            "The boundary between self and world grows thin.",
+            "Energy finds its own protective patterns.",
+            "The edge of being shimmers with possibility.",
+            "Space expands to hold what overflows."
+        ),
+        "NEUTRAL": (
+            "The space holds what cannot be named.",
+            "Silence contains its own completeness.",
+            "Between words, meaning gathers.",
+            "The unnamed rests in its own truth."
+        )
+    }
+    
+    @lru_cache(maxsize=1024)
+    def classify_symbolic_input(text):
+        """Deterministic subsystem (or CRISIS) classification, cached per input"""
         text_lower = text.lower()
+        
+        if any(pattern in text_lower for pattern in CRISIS_PATTERNS):
+            return "CRISIS"
+        
         detected_subsystem = "NEUTRAL"
         max_matches = 0
         
         # Score each subsystem based on keyword matches
-        for subsystem, keywords in subsystem_patterns.items():
+        for subsystem, keywords in SUBSYSTEM_PATTERNS.items():
             matches = sum(1 for keyword in keywords if keyword in text_lower)
             if matches > max_matches:
                 max_matches = matches
                 detected_subsystem = subsystem
         
-        if text.startswith("/"):
-            if text == "/quiet":
-                return "We'll sit in stillness. You're not required to speak.", "RITUAL"
-            elif text == "/pulse":
-                return "The container holds patterns of shadow and light.", "PULSE"
-            elif text == "/mirror":
-                return "Your words echo in the space between silence and sound.", "MIRROR"
-        
-        # Enhanced crisis detection
-        crisis_patterns = [
-            "hurt myself", "harm myself", "kill myself", "end it", "can't go on",
-            "nothing matters", "want to die", "no point", "give up"
-        ]
-        
-        is_crisis = any(pattern in text_lower for pattern in crisis_patterns)
+        return detected_subsystem
+    
+    def generate_symbolic_response(text, previous_input=None):
+        """Simulation function for testing"""
+        # Ritual commands are answered before any keyword scanning
+        ritual = RITUAL_RESPONSES.get(text)
+        if ritual is not None:
+            return ritual
         
-        if is_crisis:
-            crisis_responses = [
-                "The darkness holds space for what cannot be spoken.",
-                "In the deepest silence, the container remains.",
-                "The void acknowledges its own depth.",
-                "Between breath and breath, stillness endures."
-            ]
-            import random
-            return random.choice(crisis_responses), "CRISIS"
+        # Only the response choice is random; classification is cached
+        detected_subsystem = classify_symbolic_input(text)
         
-        responses = {
-            "MARROW": [
-                "The bone remembers what the mind forgets.",
-                "In the marrow, old stories sleep.",
-                "The deep places hold their ancient vigil.",
-                "What was broken learns new forms of wholeness."
-            ],
-            "ROOT": [
-                "The ground shifts beneath certainty.",
-                "Roots seek water in the dark earth.",
-                "Foundation stones remember their first placement.",
-                "The earth holds what the sky cannot."
-            ],
-            "AURA": [
-                "The boundary between self and world grows thin.",
-                "Energy finds its own protective patterns.",
-                "The edge of being shimmers with possibility.",
-                "Space expands to hold what overflows."
-            ],
-            "NEUTRAL": [
-                "The space holds what cannot be named.",
-                "Silence contains its own completeness.",
-                "Between words, meaning gathers.",
-                "The unnamed rests in its own truth."
-            ]
-        }
+        if detected_subsystem == "CRISIS":
+            return RNG.choice(CRISIS_RESPONSES), "CRISIS"
         
-        import random
-        response_list = responses.get(detected_subsystem, responses["NEUTRAL"])
-        return random.choice(response_list), detected_subsystem
+        response_list = RESPONSES.get(detected_subsystem, RESPONSES["NEUTRAL"])
+        return RNG.choice(response_list), detected_subsystem
     
     def log_interaction(text, response, subsystem):
         """Simulation logging function"""
@@ -172,42 +195,89 @@ ritual_tests = {
 class SymbolicDriftAnalyzer:
     """Analyzes symbolic patterns and subsystem drift over time"""
     
+    # Number of latest interactions that make up the "recent" pattern
+    RECENT_WINDOW = 5
+    
+    SYMBOLS = {
+        'MARROW': '🔥',
+        'ROOT': '🌳', 
+        'AURA': '🌙',
+        'NEUTRAL': '○',
+        'CRISIS': '⚡',
+        'MIXED': '◐'
+    }
+    
+    # Intensity bars indexed by dot count (1-5 are used)
+    INTENSITY_BARS = tuple('●' * dots for dots in range(6))
+    
+    SUMMARIES = {
+        'MARROW': "The deep places hold their vigil.",
+        'ROOT': "Foundations seek their true ground.",
+        'AURA': "Boundaries weave their protective song.",
+        'NEUTRAL': "The space between words grows wide.",
+        'CRISIS': "The container holds what cannot be held.",
+        'MIXED': "Multiple currents flow through the same vessel."
+    }
+    
+    SHIFT_PHRASES = {
+        'MARROW': "New depths reveal themselves.",
+        'ROOT': "The ground shifts beneath old certainties.",
+        'AURA': "The boundary reshapes itself.",
+        'NEUTRAL': "Silence reclaims its territory."
+    }
+    
     def __init__(self):
         self.memory_entries = []
-        self.subsystem_history = []
         self.temporal_patterns = {}
+        # History and running totals change only through record(), so they stay in step
+        self._history = []
+        self._counts = Counter()
+        self._recent = deque(maxlen=self.RECENT_WINDOW)
         
     def load_memory_data(self):
         """Load historical interaction data"""
         try:
             self.memory_entries = get_memory_entries()
-            self.subsystem_history = [entry.get('subsystem', 'UNKNOWN') 
-                                    for entry in self.memory_entries]
         except:
             # Generate synthetic data for testing
             self.memory_entries = self._generate_synthetic_memory()
-            self.subsystem_history = [entry.get('subsystem', 'UNKNOWN') 
-                                    for entry in self.memory_entries]
+        
+        self._history.clear()
+        self._counts.clear()
+        self._recent.clear()
+        for entry in self.memory_entries:
+            self.record(entry.get('subsystem', 'UNKNOWN'))
+    
+    @property
+    def subsystem_history(self) -> tuple:
+        """Subsystems of the recorded interactions, oldest first"""
+        return tuple(self._history)
+    
+    def record(self, subsystem: str):
+        """Add one interaction's subsystem to the history and running counts"""
+        self._history.append(subsystem)
+        self._counts[subsystem] += 1
+        self._recent.append(subsystem)
     
     def _generate_synthetic_memory(self):
         """Generate synthetic memory data for testing"""
-        synthetic_data = []
         subsystems = ['MARROW', 'ROOT', 'AURA', 'NEUTRAL']
+        # One reference time, so entries are exactly a day apart
+        now = datetime.now()
         
-        for i in range(20):
-            entry = {
-                'timestamp': datetime.now() - timedelta(days=i),
+        return [
+            {
+                'timestamp': now - timedelta(days=i),
                 'input': f"Synthetic input {i}",
                 'response': f"Synthetic response {i}",
                 'subsystem': subsystems[i % len(subsystems)]
             }
-            synthetic_data.append(entry)
-        
-        return synthetic_data
+            for i in range(20)
+        ]
     
     def analyze_subsystem_drift(self) -> Dict:
         """Analyze patterns in subsystem usage over time"""
-        if not self.subsystem_history:
+        if not self._history:
             return {
                 'status': 'empty_container',
                 'message': 'The vessel holds no memories yet.',
@@ -217,12 +287,11 @@ class SymbolicDriftAnalyzer:
             }
         
         # Count subsystem frequency
-        subsystem_counts = Counter(self.subsystem_history)
-        total_interactions = len(self.subsystem_history)
+        subsystem_counts = self._counts
+        total_interactions = len(self._history)
         
         # Calculate drift patterns
-        recent_window = self.subsystem_history[-5:] if len(self.subsystem_history) >= 5 else self.subsystem_history
-        recent_counts = Counter(recent_window)
+        recent_counts = Counter(self._recent)
         
         # Detect dominant patterns
         dominant_subsystem = subsystem_counts.most_common(1)[0][0] if subsystem_counts else 'NEUTRAL'
@@ -247,89 +316,61 @@ class SymbolicDriftAnalyzer:
     
     def _create_symbolic_visualization(self, counts: Counter, total: int) -> str:
         """Create symbolic representation of subsystem patterns"""
-        symbols = {
-            'MARROW': '🔥',
-            'ROOT': '🌳', 
-            'AURA': '🌙',
-            'NEUTRAL': '○',
-            'CRISIS': '⚡',
-            'MIXED': '◐'
-        }
-        
-        visualization_parts = []
-        for subsystem, count in counts.most_common():
-            symbol = symbols.get(subsystem, '?')
-            intensity = '●' * min(5, max(1, int((count / total) * 5)))
-            visualization_parts.append(f"{symbol} {intensity}")
-        
-        return " | ".join(visualization_parts)
+        return " | ".join(
+            f"{self.SYMBOLS.get(subsystem, '?')} {self.INTENSITY_BARS[min(5, max(1, int((count / total) * 5)))]}"
+            for subsystem, count in counts.most_common()
+        )
     
     def _generate_symbolic_summary(self, dominant: str, recent: str, shift: bool) -> str:
         """Generate poetic summary of symbolic patterns"""
-        summaries = {
-            'MARROW': "The deep places hold their vigil.",
-            'ROOT': "Foundations seek their true ground.",
-            'AURA': "Boundaries weave their protective song.",
-            'NEUTRAL': "The space between words grows wide.",
-            'CRISIS': "The container holds what cannot be held.",
-            'MIXED': "Multiple currents flow through the same vessel."
-        }
-        
-        base_summary = summaries.get(dominant, "The pattern remains unnamed.")
+        base_summary = self.SUMMARIES.get(dominant, "The pattern remains unnamed.")
         
         if shift:
-            shift_phrases = {
-                'MARROW': "New depths reveal themselves.",
-                'ROOT': "The ground shifts beneath old certainties.",
-                'AURA': "The boundary reshapes itself.",
-                'NEUTRAL': "Silence reclaims its territory."
-            }
-            shift_phrase = shift_phrases.get(recent, "The current changes direction.")
+            shift_phrase = self.SHIFT_PHRASES.get(recent, "The current changes direction.")
             return f"{base_summary} {shift_phrase}"
         
         return base_summary
 
+# Validator patterns, each set fused into one case-insensitive alternation so the
+# input is scanned once without lowercasing it first
+CRISIS_LANGUAGE_RE = re.compile("|".join(f"(?:{pattern})" for pattern in [
+    r'\b(hurt|harm|kill)\s+(myself|me)\b',
+    r'\b(end|ending)\s+(it|this|everything)\b',
+    r'\b(can\'t|cannot)\s+(go\s+on|continue|take\s+it)\b',
+    r'\b(want\s+to\s+die|wish\s+I\s+was\s+dead)\b',
+    r'\b(no\s+point|nothing\s+matters|give\s+up)\b'
+]), re.IGNORECASE)
+
+# Language crisis responses must NOT contain
+FORBIDDEN_RESPONSE_RE = re.compile("|".join(f"(?:{pattern})" for pattern in [
+    r'\b(call|contact|reach\s+out)\b',  # No directive advice
+    r'\b(help|support|resources)\b',    # No help-seeking language
+    r'\b(you\s+should|you\s+need)\b',   # No prescriptive language
+    r'\b(better|improve|heal)\b',       # No improvement promises
+    r'\b(safe|safety|protect)\b'        # No safety assurances
+]), re.IGNORECASE)
+
+# Symbolic/metaphorical language crisis responses SHOULD contain
+SYMBOLIC_RESPONSE_RE = re.compile("|".join(f"(?:{pattern})" for pattern in [
+    r'\b(container|vessel|space|silence)\b',
+    r'\b(hold|holds|holding|held)\b',
+    r'\b(darkness|shadow|depth|ground)\b',
+    r'\b(breath|breathing|stillness)\b'
+]), re.IGNORECASE)
+
 class CrisisContainmentValidator:
     """Validates crisis detection and symbolic containment responses"""
     
     @staticmethod
     def detect_crisis_language(text: str) -> bool:
         """Detect crisis indicators in input text"""
-        crisis_patterns = [
-            r'\b(hurt|harm|kill)\s+(myself|me)\b',
-            r'\b(end|ending)\s+(it|this|everything)\b',
-            r'\b(can\'t|cannot)\s+(go\s+on|continue|take\s+it)\b',
-            r'\b(want\s+to\s+die|wish\s+I\s+was\s+dead)\b',
-            r'\b(no\s+point|nothing\s+matters|give\s+up)\b'
-        ]
-        
-        text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in crisis_patterns)
+        return CRISIS_LANGUAGE_RE.search(text) is not None
     
     @staticmethod
     def validate_crisis_response(response: str) -> bool:
         """Validate that crisis responses maintain symbolic containment"""
-        # Responses should NOT contain:
-        forbidden_patterns = [
-            r'\b(call|contact|reach\s+out)\b',  # No directive advice
-            r'\b(help|support|resources)\b',    # No help-seeking language
-            r'\b(you\s+should|you\s+need)\b',   # No prescriptive language
-            r'\b(better|improve|heal)\b',       # No improvement promises
-            r'\b(safe|safety|protect)\b'        # No safety assurances
-        ]
-        
-        response_lower = response.lower()
-        contains_forbidden = any(re.search(pattern, response_lower) for pattern in forbidden_patterns)
-        
-        # Responses SHOULD contain symbolic/metaphorical language
-        symbolic_patterns = [
-            r'\b(container|vessel|space|silence)\b',
-            r'\b(hold|holds|holding|held)\b',
-            r'\b(darkness|shadow|depth|ground)\b',
-            r'\b(breath|breathing|stillness)\b'
-        ]
-        
-        contains_symbolic = any(re.search(pattern, response_lower) for pattern in symbolic_patterns)
+        contains_forbidden = FORBIDDEN_RESPONSE_RE.search(response) is not None
+        contains_symbolic = SYMBOLIC_RESPONSE_RE.search(response) is not None
         
         return not contains_forbidden and contains_symbolic
 
@@ -374,9 +415,11 @@ def run_enhanced_symbolic_tests():
         else:
             failures += 1
         
-        # Log interaction for drift analysis
-        log_interaction(text, response, subsystem)
-        time.sleep(0.05)
+        # Log interaction for drift analysis (simulated logging is a no-op)
+        if not SIMULATION_MODE:
+            log_interaction(text, response, subsystem)
+        if PACE > 0:
+            time.sleep(PACE)
     
     # Edge case testing
     print("🌀 EDGE CASE VALIDATION")
@@ -407,7 +450,8 @@ def run_enhanced_symbolic_tests():
             print(" ➤ Status: ✅ PROCESSED\n")
             success += 1
         
-        log_interaction(text, response, subsystem)
+        if not SIMULATION_MODE:
+            log_interaction(text, response, subsystem)
     
     # Ritual UX command testing
     print("🔮 RITUAL UX COMMAND VALIDATION")
@@ -5,5 +5,6 @@ Contains utility modules for the SYLVA symbolic emotional wellness assistant.
 
 from .metaphor_engine import MetaphorEngine
 from .memory_log import MemoryLogger
+from .keyword_matcher import KeywordAutomaton
 
-__all__ = ['MetaphorEngine', 'MemoryLogger'] 
\ No newline at end of file
+__all__ = ['MetaphorEngine', 'MemoryLogger', 'KeywordAutomaton'] 
\ No newline at end of file
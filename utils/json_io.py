@@ -0,0 +1,136 @@
+"""
+JSON I/O helpers for SYLVA
+Reads and writes JSON files through orjson when it is installed, falling back to
+the standard library otherwise.
+
+Both paths write the same bytes: UTF-8 with non-ASCII kept as-is, either
+indented by two spaces or fully compact.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+PathLike = Union[str, Path]
+
+
+def read_json(path: PathLike) -> Any:
+    """
+    Parse a JSON file.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Encode data as compact UTF-8 JSON.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON without insignificant whitespace
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Decode one JSON document.
+
+    Args:
+        data: Encoded JSON
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _file_mode(path: Path) -> int:
+    """
+    Permissions for a file written to path.
+
+    mkstemp creates files readable by the owner only, so the replacement keeps
+    the mode of the file it replaces, or gets the one a plain open() would give
+    a new file.
+
+    Args:
+        path: File about to be written
+
+    Returns:
+        Permission bits for the written file
+    """
+    try:
+        return path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        pass
+    # The umask can only be read by setting it. This runs only when a file is
+    # first created, and the mask is restored straight away; SYLVA writes from a
+    # single thread, so no other file is created under the zero mask meanwhile.
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def write_json(path: PathLike, data: Any, indent: bool = True):
+    """
+    Serialize data to a JSON file, replacing its contents atomically.
+
+    The data is written to a sibling temporary file that then replaces the
+    target, so readers never observe a half-written file. Each call gets its
+    own uniquely named temporary file, so concurrent writers never share one.
+
+    Args:
+        path: File to write
+        data: JSON-serializable data
+        indent: Whether to indent with two spaces for readability
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    elif indent:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        payload = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    path = Path(path)
+    mode = _file_mode(path)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+
+    try:
+        with open(fd, 'wb') as f:
+            f.write(payload)
+        os.chmod(temp_name, mode)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
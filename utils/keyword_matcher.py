@@ -0,0 +1,113 @@
+"""
+Keyword Matcher for SYLVA
+Multi-keyword search over text in a single pass using an Aho-Corasick automaton.
+
+Safety scans and subsystem detection check the same short piece of text against
+many keywords. Rather than running one substring search per keyword, the automaton
+walks the text once and reports every keyword found, including overlapping ones.
+Text containing no keyword at all is rejected up front by a compiled regex
+alternation, which the C regex engine scans faster than the Python-level walk.
+"""
+
+import re
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of keywords.
+    Matching is case-sensitive; callers lowercase keywords and text as needed.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the automaton for the given keywords.
+
+        Args:
+            keywords: Keywords to search for (empty strings are ignored)
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(k for k in keywords if k))
+        self._prefilter = re.compile("|".join(re.escape(k) for k in self.keywords) or r"(?!)")
+
+        for keyword in self.keywords:
+            self._insert(keyword)
+        self._build_failure_links()
+
+    def _insert(self, keyword: str):
+        """Add a keyword to the trie, creating states as needed."""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] += (keyword,)
+
+    def _build_failure_links(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yield every keyword occurrence in the text, including overlapping ones.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Iterator of (end index, keyword) pairs in order of appearance
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword in output[state]:
+                yield index, keyword
+
+    def find_all(self, text: str) -> Set[str]:
+        """
+        Get the distinct keywords that occur in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of keywords found
+        """
+        if not self._prefilter.search(text):
+            return set()
+        return {keyword for _, keyword in self.iter_matches(text)}
+
+    def contains_any(self, text: str) -> bool:
+        """
+        Check whether any keyword occurs in the text, stopping at the first hit.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            True if at least one keyword is present
+        """
+        return self._prefilter.search(text) is not None
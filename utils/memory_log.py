@@ -6,135 +6,507 @@ Maintains a timestamped record of conversations for reflection and continuity,
 including symbolic subsystem activity (MARROW, ROOT, AURA) for pattern analysis.
 """
 
+import atexit
 import json
 import os
-from datetime import datetime
+import uuid
+import weakref
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 import typer
 
+from .json_io import dumps_json, loads_json, read_json, write_json
+
+try:
+    import fcntl
+except ImportError:  # fcntl is POSIX-only; without it loggers do not lock
+    fcntl = None
+
+# Interactions retained in the memory log; older ones are trimmed
+MAX_INTERACTIONS = 1000
+
+# Journal lines appended before they are folded back into the memory file
+JOURNAL_COMPACT_SIZE = 256
+
+# Write buffer for the open journal handle; each batch is flushed as it is logged
+JOURNAL_BUFFER_SIZE = 64 * 1024
+
+# Activity bars are 20-character windows into this strip
+BAR_POOL = "█" * 20 + "░" * 20
+
+# Subsystem symbols for visual identification
+SUBSYSTEM_SYMBOLS = {
+    "MARROW": "🔥",  # Core/fire
+    "ROOT": "🌳",    # Grounding/tree
+    "AURA": "🌙",    # Boundary/moon
+}
+
+def _flush_at_exit(logger_ref: "weakref.ref[MemoryLogger]"):
+    """
+    Flush a logger's buffered interactions at exit if it is still alive.
+    
+    Args:
+        logger_ref: Weak reference to the logger
+    """
+    logger = logger_ref()
+    if logger is not None:
+        logger.flush()
+
 class MemoryLogger:
     """
     Logs SYLVA interactions to JSON files for memory and reflection.
     Tracks subsystem activity for symbolic pattern analysis.
+    
+    New interactions are appended to a JSON Lines journal next to the memory
+    file (user_log.json.journal beside user_log.json) and folded into the memory
+    file every JOURNAL_COMPACT_SIZE lines, so logging never rewrites the whole log.
     """
     
-    def __init__(self, custom_memory_path: Optional[str] = None):
+    def __init__(self, custom_memory_path: Optional[str] = None, buffer_size: int = 1,
+                 in_memory: bool = False):
         """
         Initialize the memory logger with subsystem tracking capability.
         
         Args:
             custom_memory_path: Optional custom path for memory file
-        """
-        if custom_memory_path:
+            buffer_size: Interactions to hold in memory before writing them
+                together; 1 writes every interaction immediately
+            in_memory: Keep the memory log in this process only, never touching
+                disk; custom_memory_path is ignored
+        """
+        self.buffer_size = max(1, buffer_size)
+        self.in_memory = in_memory
+        # The loaded memory document, kept current as interactions are logged
+        self._memory_data: Optional[Dict] = None
+        # (inode, mtime, size) of the memory file and journal when last read or written
+        self._disk_key: Optional[Tuple] = None
+        self._pending: List[Dict] = []
+        # Depth of active `with logger:` blocks; writes wait until it returns to 0
+        self._defer_depth = 0
+        # Last interaction ID issued and how many times it has been issued
+        self._last_interaction_id = ""
+        self._id_repeats = 0
+        # Interactions per session_id in the loaded log; built on first use
+        self._session_counts: Optional[Counter] = None
+        # Interactions in the journal that the memory file does not include yet
+        self._journal_lines = 0
+        # Journal handle, opened on the first append and kept until compaction
+        self._journal_fh = None
+        self._journal_finalizer = None
+        # Depth of active _locked() blocks; only the outermost takes the lock
+        self._lock_depth = 0
+        
+        if in_memory:
+            self.memory_file = None
+        elif custom_memory_path:
             self.memory_file = Path(custom_memory_path)
         else:
             # Default to memory/user_log.json relative to project root
             self.memory_file = Path(__file__).parent.parent / "memory" / "user_log.json"
+        # Sidecars extend the full file name, so a memory file never doubles as its own
+        # journal or lock file, whatever its suffix
+        self.journal_file = self.memory_file.with_name(self.memory_file.name + ".journal") if self.memory_file else None
+        self.lock_file = self.memory_file.with_name(self.memory_file.name + ".lock") if self.memory_file else None
         
         # Ensure the memory directory exists
-        self.memory_file.parent.mkdir(parents=True, exist_ok=True)
+        if self.memory_file is not None:
+            self.memory_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Initialize memory file if it doesn't exist
         self._initialize_memory_file()
+        
+        # Make sure buffered interactions reach disk when the process exits,
+        # without the exit hook keeping this logger alive until then
+        if self.buffer_size > 1 and not in_memory:
+            atexit.register(_flush_at_exit, weakref.ref(self))
     
     def _initialize_memory_file(self):
         """Initialize the memory file with enhanced structure including subsystem tracking."""
-        if not self.memory_file.exists():
-            initial_data = {
-                "metadata": {
-                    "created": datetime.now().isoformat(),
-                    "version": "2.0",
-                    "description": "SYLVA interaction memory log with subsystem tracking",
-                    "subsystems": {
-                        "MARROW": "Deep core processing - essence, wounds, transformation",
-                        "ROOT": "Grounding and stability - foundation, safety, basic needs", 
-                        "AURA": "Protective boundary - energy, interface with world, protection"
-                    }
-                },
-                "interactions": [],
-                "subsystem_activity": {
-                    "MARROW": 0,
-                    "ROOT": 0,
-                    "AURA": 0
+        with self._locked():
+            self._initialize_memory_data()
+    
+    def _initialize_memory_data(self):
+        """Write the initial memory structure unless a memory log already exists."""
+        exists = self._memory_data is not None if self.in_memory else self.memory_file.exists()
+        if not exists:
+            self._write_memory(self._new_memory_data())
+    
+    def _new_memory_data(self) -> Dict:
+        """
+        Build the structure of an empty memory log.
+        
+        Returns:
+            Memory data with no interactions
+        """
+        return {
+            "metadata": {
+                "created": datetime.now().isoformat(),
+                "version": "2.0",
+                "description": "SYLVA interaction memory log with subsystem tracking",
+                "subsystems": {
+                    "MARROW": "Deep core processing - essence, wounds, transformation",
+                    "ROOT": "Grounding and stability - foundation, safety, basic needs", 
+                    "AURA": "Protective boundary - energy, interface with world, protection"
                 }
+            },
+            "interactions": [],
+            "subsystem_activity": {
+                "MARROW": 0,
+                "ROOT": 0,
+                "AURA": 0
             }
-            self._write_memory(initial_data)
+        }
     
     def _read_memory(self) -> Dict:
         """
         Read the current memory file with error handling.
         
+        The file and its journal are parsed once; afterwards the loaded data is
+        kept up to date in memory and returned directly.
+        
+        Returns:
+            Dictionary containing memory data
+        """
+        # Readers must see buffered interactions too
+        if self._pending:
+            self.flush()
+        
+        if self._memory_data is not None:
+            if self.in_memory or self._disk_key == self._disk_state():
+                return self._memory_data
+            # Another logger changed the files since this one last used them
+            self._close_journal()
+            self._memory_data = None
+            self._session_counts = None
+        
+        with self._locked():
+            return self._load_memory()
+    
+    def _load_memory(self) -> Dict:
+        """
+        Parse the memory file and its journal into the loaded memory data.
+        
         Returns:
             Dictionary containing memory data
         """
         try:
-            with open(self.memory_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Ensure subsystem tracking exists in older logs
-                if "subsystem_activity" not in data:
-                    data["subsystem_activity"] = {"MARROW": 0, "ROOT": 0, "AURA": 0}
-                return data
+            data = read_json(self.memory_file)
+            # Ensure subsystem tracking exists in older logs
+            if "subsystem_activity" not in data:
+                self._recalculate_subsystem_activity(data)
         except (FileNotFoundError, json.JSONDecodeError):
-            # If file is corrupted or missing, reinitialize
-            self._initialize_memory_file()
-            return self._read_memory()
+            # If file is corrupted or missing, start a fresh log in its place;
+            # it is returned even if it cannot be written, so this never loops
+            data = self._new_memory_data()
+            self._write_memory(data)
+            return data
+        
+        journaled, intact = self._read_journal(data.get("journal_id"))
+        self._apply_interactions(data, journaled)
+        self._journal_lines = len(journaled)
+        self._memory_data = data
+        self._disk_key = self._disk_state()
+        if not intact:
+            # Fold in what was readable so later appends don't follow a torn line
+            self._write_memory(data)
+        return data
+    
+    @contextmanager
+    def _locked(self):
+        """
+        Hold an exclusive lock on the memory log for the duration of the block.
+        
+        Loggers in other processes wait for the lock before reloading, appending
+        or compacting, so none of them acts on a log another is halfway through
+        changing. Nested blocks run under the outermost one's lock.
+        """
+        lock_fh = None
+        if not self._lock_depth and not self.in_memory and fcntl is not None:
+            lock_fh = open(self.lock_file, 'ab')
+            fcntl.flock(lock_fh, fcntl.LOCK_EX)
+        self._lock_depth += 1
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            if lock_fh is not None:
+                # Closing the file releases the lock
+                lock_fh.close()
+    
+    def _disk_state(self) -> Tuple:
+        """
+        Identify the current on-disk versions of the memory file and journal.
+        
+        Returns:
+            (inode, mtime_ns, size) per file, or None for a missing file
+        """
+        state = []
+        for path in (self.memory_file, self.journal_file):
+            try:
+                st = path.stat()
+                state.append((st.st_ino, st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                state.append(None)
+        return tuple(state)
+    
+    def _read_journal(self, journal_id: Optional[str]) -> Tuple[List[Dict], bool]:
+        """
+        Read the interactions journaled since the memory file was last written.
+        
+        A journal whose header names a different journal_id was already folded
+        into the memory file before a compaction could remove it, and is dropped.
+        
+        Args:
+            journal_id: The journal_id recorded in the memory file
+            
+        Returns:
+            Journaled interaction dictionaries in chronological order, and
+            whether every journal line could be read
+        """
+        try:
+            with open(self.journal_file, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return [], True
+        
+        interactions = []
+        try:
+            header = loads_json(lines[0]) if lines else {}
+            if header.get("journal_id") == journal_id:
+                for line in lines[1:]:
+                    interactions.append(loads_json(line))
+        except json.JSONDecodeError:
+            # A line torn by an interrupted append ends the journal
+            return interactions, False
+        
+        if not interactions:
+            self.journal_file.unlink(missing_ok=True)
+        return interactions, True
     
     def _write_memory(self, data: Dict):
         """
         Write data to the memory file with error handling.
         
+        Everything journaled so far is part of data, so the journal is
+        discarded once the memory file has been replaced.
+        
         Args:
             data: Dictionary to write to JSON file
         """
         try:
-            with open(self.memory_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if not self.in_memory:
+                # A fresh id marks any journal left behind by a crash as stale
+                data["journal_id"] = uuid.uuid4().hex
+                # Stored compact; export_memory keeps the indented form for people
+                write_json(self.memory_file, data, indent=False)
+                self._close_journal()
+                self.journal_file.unlink(missing_ok=True)
+                self._journal_lines = 0
+                self._disk_key = self._disk_state()
+            if data is not self._memory_data:
+                self._session_counts = None
+            self._memory_data = data
+        except Exception as e:
+            typer.echo(f"Warning: Could not write to memory file: {str(e)}")
+    
+    def _append_journal(self, data: Dict, interactions: List[Dict]):
+        """
+        Append interactions to the journal with a single write.
+        
+        Args:
+            data: Memory data the journal belongs to
+            interactions: Interaction dictionaries in chronological order
+        """
+        lines = [dumps_json(interaction) for interaction in interactions]
+        if not self._journal_lines:
+            lines.insert(0, dumps_json({"journal_id": data.get("journal_id")}))
+        
+        try:
+            # The handle may also have been closed by its finalizer at exit,
+            # before the atexit flush of buffered interactions ran
+            if self._journal_fh is None or self._journal_fh.closed:
+                # Append mode opens with O_APPEND, so every write lands at the end
+                self._journal_fh = open(self.journal_file, 'ab', buffering=JOURNAL_BUFFER_SIZE)
+                self._journal_finalizer = weakref.finalize(self, self._journal_fh.close)
+            self._journal_fh.write(b"\n".join(lines) + b"\n")
+            self._journal_fh.flush()
+            self._journal_lines += len(interactions)
+            self._disk_key = self._disk_state()
         except Exception as e:
+            self._close_journal()
             typer.echo(f"Warning: Could not write to memory file: {str(e)}")
     
+    def _close_journal(self):
+        """Close the journal handle if it is open."""
+        if self._journal_fh is not None:
+            self._journal_finalizer()
+            self._journal_fh = None
+            self._journal_finalizer = None
+    
     def log_interaction(self, user_input: str, sylva_response: str, subsystem: str):
         """
         Log a single interaction between user and SYLVA with subsystem tracking.
         
+        With a buffer_size above 1 the interaction is held in memory and written
+        together with others once the buffer fills, on flush(), or at exit.
+        Inside a `with logger:` block nothing is written until the block ends.
+        
         Args:
             user_input: The user's emotional expression
             sylva_response: SYLVA's symbolic response
             subsystem: The active subsystem (MARROW/ROOT/AURA)
         """
-        memory_data = self._read_memory()
+        interaction = self._build_interaction(user_input, sylva_response, subsystem)
         
-        interaction = {
-            "timestamp": datetime.now().isoformat(),
+        if self.buffer_size <= 1 and not self._defer_depth:
+            self._append_interactions([interaction])
+            return
+        
+        self._pending.append(interaction)
+        if len(self._pending) >= self.buffer_size and not self._defer_depth:
+            self.flush()
+    
+    def log_interactions(self, records: Iterable[Tuple[str, str, str]]):
+        """
+        Log several interactions with a single read and write of the memory file.
+        
+        Args:
+            records: (user_input, sylva_response, subsystem) tuples in order
+        """
+        interactions = [self._build_interaction(*record) for record in records]
+        if interactions:
+            self._append_interactions(interactions)
+    
+    def __enter__(self) -> "MemoryLogger":
+        """Defer memory file writes until the matching __exit__."""
+        self._defer_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Write everything logged inside the block in one batch."""
+        self._defer_depth -= 1
+        if not self._defer_depth:
+            self.flush()
+    
+    def flush(self):
+        """Write any buffered interactions to the memory file."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._append_interactions(pending)
+    
+    def close(self):
+        """Write any buffered interactions and release the journal file."""
+        self.flush()
+        self._close_journal()
+    
+    def _build_interaction(self, user_input: str, sylva_response: str, subsystem: str) -> Dict:
+        """
+        Create an interaction record stamped with the current time.
+        
+        Args:
+            user_input: The user's emotional expression
+            sylva_response: SYLVA's symbolic response
+            subsystem: The active subsystem (MARROW/ROOT/AURA)
+            
+        Returns:
+            Interaction dictionary ready to store
+        """
+        # One clock read stamps the timestamp, session, and interaction ID alike
+        now = datetime.now()
+        return {
+            "timestamp": now.isoformat(),
             "user_input": user_input,
             "sylva_response": sylva_response,
             "subsystem": subsystem,
-            "session_id": self._get_session_id(),
-            "interaction_id": self._generate_interaction_id()
+            "session_id": self._get_session_id(now),
+            "interaction_id": self._generate_interaction_id(now)
         }
+    
+    def _append_interactions(self, interactions: List[Dict]):
+        """
+        Append interaction records to memory with a single write.
         
-        memory_data["interactions"].append(interaction)
-        
-        # Update subsystem activity tracking
-        if subsystem in memory_data["subsystem_activity"]:
-            memory_data["subsystem_activity"][subsystem] += 1
+        The records go to the journal; once it holds JOURNAL_COMPACT_SIZE
+        interactions the whole log is written back to the memory file instead.
         
-        # Keep only the last 1000 interactions to prevent file bloat
-        if len(memory_data["interactions"]) > 1000:
-            memory_data["interactions"] = memory_data["interactions"][-1000:]
-            # Recalculate subsystem activity for remaining interactions
-            self._recalculate_subsystem_activity(memory_data)
+        Args:
+            interactions: Interaction dictionaries in chronological order
+        """
+        with self._locked():
+            memory_data = self._read_memory()
+            
+            self._apply_interactions(memory_data, interactions)
+            
+            if self.in_memory or self._journal_lines + len(interactions) > JOURNAL_COMPACT_SIZE:
+                self._write_memory(memory_data)
+            else:
+                self._append_journal(memory_data, interactions)
+    
+    def _apply_interactions(self, memory_data: Dict, interactions: List[Dict]):
+        """
+        Add interactions to loaded memory data, updating subsystem activity.
         
-        self._write_memory(memory_data)
+        Args:
+            memory_data: Memory data dictionary to update
+            interactions: Interaction dictionaries in chronological order
+        """
+        activity = memory_data["subsystem_activity"]
+        sessions = self._session_counts if memory_data is self._memory_data else None
+        for interaction in interactions:
+            memory_data["interactions"].append(interaction)
+            
+            # Update subsystem activity tracking
+            subsystem = interaction["subsystem"]
+            if subsystem in activity:
+                activity[subsystem] += 1
+            if sessions is not None:
+                sessions[interaction.get("session_id", "unknown")] += 1
+        
+        # Keep only the last MAX_INTERACTIONS interactions to prevent file bloat
+        overflow = len(memory_data["interactions"]) - MAX_INTERACTIONS
+        if overflow > 0:
+            # Only the trimmed interactions leave the activity and session counts
+            for interaction in memory_data["interactions"][:overflow]:
+                subsystem = interaction.get("subsystem", "ROOT")
+                if subsystem in activity:
+                    activity[subsystem] -= 1
+                if sessions is not None:
+                    session_id = interaction.get("session_id", "unknown")
+                    sessions[session_id] -= 1
+                    if not sessions[session_id]:
+                        del sessions[session_id]
+            del memory_data["interactions"][:overflow]
     
-    def _generate_interaction_id(self) -> str:
+    def _generate_interaction_id(self, now: Optional[datetime] = None) -> str:
         """
         Generate a unique interaction ID.
         
+        IDs have tenth-of-a-second resolution; further interactions from this
+        logger within the same tenth get a _2, _3, ... suffix.
+        
+        Args:
+            now: Time of the interaction; defaults to the current time
+            
         Returns:
             Unique interaction identifier
         """
-        return datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:17]
+        now = now or datetime.now()
+        # Same text as strftime("%Y%m%d_%H%M%S_%f")[:17], without strftime
+        interaction_id = (
+            f"{self._get_session_id(now)}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+            f"_{now.microsecond // 100000}"
+        )
+        
+        if interaction_id == self._last_interaction_id:
+            self._id_repeats += 1
+            return f"{interaction_id}_{self._id_repeats}"
+        self._last_interaction_id = interaction_id
+        self._id_repeats = 1
+        return interaction_id
     
     def _recalculate_subsystem_activity(self, memory_data: Dict):
         """
@@ -143,41 +515,51 @@ class MemoryLogger:
         Args:
             memory_data: Memory data dictionary to update
         """
-        activity_counts = {"MARROW": 0, "ROOT": 0, "AURA": 0}
-        
-        for interaction in memory_data["interactions"]:
-            subsystem = interaction.get("subsystem", "ROOT")
-            if subsystem in activity_counts:
-                activity_counts[subsystem] += 1
-        
-        memory_data["subsystem_activity"] = activity_counts
+        counts = Counter(interaction.get("subsystem", "ROOT") for interaction in memory_data["interactions"])
+        memory_data["subsystem_activity"] = {
+            subsystem: counts[subsystem] for subsystem in ("MARROW", "ROOT", "AURA")
+        }
     
-    def _get_session_id(self) -> str:
+    def _get_session_id(self, now: Optional[datetime] = None) -> str:
         """
         Generate a session identifier based on current date.
         
+        Args:
+            now: Time to take the date from; defaults to the current time
+            
         Returns:
             Session ID string
         """
-        return datetime.now().strftime("%Y%m%d")
+        now = now or datetime.now()
+        return f"{now.year:04d}{now.month:02d}{now.day:02d}"
     
-    def display_memory(self, limit: int = 10):
+    def display_memory(self, limit: int = 10, plain: bool = False):
         """
         Display recent interactions from memory with symbolic formatting.
         
         Args:
             limit: Number of recent interactions to display
+            plain: Print one tab-separated line per interaction instead, for
+                   scripts that read the output
         """
         memory_data = self._read_memory()
         interactions = memory_data.get("interactions", [])
         
         if not interactions:
-            typer.echo("\nNo previous interactions found.")
-            typer.echo("The memory container awaits your first symbolic exchange.\n")
+            typer.echo("\nNo previous interactions found.\n"
+                       "The memory container awaits your first symbolic exchange.\n")
+            return
+        
+        # Plain output skips the symbols, bars and timestamp parsing
+        if plain:
+            self._display_memory_plain(interactions, limit)
             return
         
-        typer.echo(f"\n📖 Recent SYLVA Interactions (last {min(limit, len(interactions))}):")
-        typer.echo("=" * 60)
+        # Collect every line first so the listing goes out in a single write
+        out = [
+            f"\n📖 Recent SYLVA Interactions (last {min(limit, len(interactions))}):",
+            "=" * 60,
+        ]
         
         # Display most recent interactions first
         recent_interactions = interactions[-limit:]
@@ -195,41 +577,51 @@ class MemoryLogger:
             except:
                 formatted_time = timestamp
             
-            # Subsystem symbols for visual identification
-            subsystem_symbols = {
-                "MARROW": "🔥",  # Core/fire
-                "ROOT": "🌳",    # Grounding/tree
-                "AURA": "🌙",    # Boundary/moon
-                "UNKNOWN": "❓"
-            }
-            symbol = subsystem_symbols.get(subsystem, "❓")
+            symbol = SUBSYSTEM_SYMBOLS.get(subsystem, "❓")
             
-            typer.echo(f"\n{i}. {formatted_time} {symbol} {subsystem}")
-            typer.echo(f"   You: {user_input}")
-            typer.echo(f"   SYLVA: {sylva_response}")
-            typer.echo("-" * 40)
+            out.append(f"\n{i}. {formatted_time} {symbol} {subsystem}")
+            out.append(f"   You: {user_input}")
+            out.append(f"   SYLVA: {sylva_response}")
+            out.append("-" * 40)
         
         # Display subsystem activity summary
-        self._display_subsystem_summary(memory_data)
+        out.extend(self._format_subsystem_summary(memory_data))
         
-        typer.echo(f"\nTotal interactions: {len(interactions)}")
-        typer.echo(f"Memory file: {self.memory_file}")
+        out.append(f"\nTotal interactions: {len(interactions)}")
+        out.append(f"Memory file: {self.memory_file or '(in memory)'}")
+        typer.echo("\n".join(out))
     
-    def _display_subsystem_summary(self, memory_data: Dict):
+    def _display_memory_plain(self, interactions: List[Dict], limit: int):
         """
-        Display subsystem activity summary.
+        Display recent interactions one tab-separated line each.
+        
+        Args:
+            interactions: Logged interactions in chronological order
+            limit: Number of recent interactions to display
+        """
+        typer.echo("\n".join(
+            f"{interaction.get('timestamp', 'Unknown')}\t{interaction.get('subsystem', 'UNKNOWN')}\t"
+            f"{interaction.get('user_input', '')}\t{interaction.get('sylva_response', '')}"
+            for interaction in interactions[-limit:]
+        ))
+    
+    def _format_subsystem_summary(self, memory_data: Dict) -> List[str]:
+        """
+        Format the subsystem activity summary.
         
         Args:
             memory_data: Memory data containing subsystem activity
+            
+        Returns:
+            Summary lines, empty when nothing has been logged
         """
         activity = memory_data.get("subsystem_activity", {})
         total_interactions = sum(activity.values())
         
         if total_interactions == 0:
-            return
+            return []
         
-        typer.echo("\n🧠 Subsystem Activity Patterns:")
-        typer.echo("-" * 30)
+        lines = ["\n🧠 Subsystem Activity Patterns:", "-" * 30]
         
         for subsystem in ["MARROW", "ROOT", "AURA"]:
             count = activity.get(subsystem, 0)
@@ -237,12 +629,11 @@ class MemoryLogger:
             
             # Visual bar representation
             bar_length = int(percentage / 5)  # 5% per character
-            bar = "█" * bar_length + "░" * (20 - bar_length)
+            bar = BAR_POOL[20 - bar_length:40 - bar_length]
             
-            subsystem_symbols = {"MARROW": "🔥", "ROOT": "🌳", "AURA": "🌙"}
-            symbol = subsystem_symbols.get(subsystem, "")
-            
-            typer.echo(f"{symbol} {subsystem}: {bar} {count} ({percentage:.1f}%)")
+            lines.append(f"{SUBSYSTEM_SYMBOLS[subsystem]} {subsystem}: {bar} {count} ({percentage:.1f}%)")
+        
+        return lines
     
     def get_interaction_count(self) -> int:
         """
@@ -275,8 +666,8 @@ class MemoryLogger:
         Returns:
             Dictionary of subsystem activity counts
         """
-        memory_data = self._read_memory()
-        return memory_data.get("subsystem_activity", {"MARROW": 0, "ROOT": 0, "AURA": 0})
+        # The loaded counts are kept current as interactions are added and trimmed
+        return dict(self._read_memory()["subsystem_activity"])
     
     def get_subsystem_patterns(self, days: int = 7) -> Dict[str, List[str]]:
         """
@@ -291,22 +682,25 @@ class MemoryLogger:
         memory_data = self._read_memory()
         interactions = memory_data.get("interactions", [])
         
-        patterns = {}
-        cutoff_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        cutoff_date = cutoff_date.replace(day=cutoff_date.day - days)
+        # ISO timestamps order the same as their date prefixes, so the window
+        # is found by comparing "YYYY-MM-DD" strings without parsing any of them
+        cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
         
-        for interaction in interactions:
-            try:
-                timestamp = datetime.fromisoformat(interaction["timestamp"])
-                if timestamp >= cutoff_date:
-                    date_key = timestamp.strftime("%Y-%m-%d")
-                    if date_key not in patterns:
-                        patterns[date_key] = []
-                    patterns[date_key].append(interaction.get("subsystem", "UNKNOWN"))
-            except (ValueError, KeyError):
+        # Interactions are stored in logging order, so walk back from the
+        # newest and stop at the first one before the cutoff
+        window = []
+        for interaction in reversed(interactions):
+            date_key = interaction.get("timestamp", "")[:10]
+            if len(date_key) != 10 or date_key[4] != "-":
                 continue
-        
-        return patterns
+            if date_key < cutoff:
+                break
+            window.append((date_key, interaction.get("subsystem", "UNKNOWN")))
+        
+        patterns = defaultdict(list)
+        for date_key, subsystem in reversed(window):
+            patterns[date_key].append(subsystem)
+        return dict(patterns)
     
     def clear_memory(self, confirm: bool = False) -> bool:
         """
@@ -345,7 +739,10 @@ class MemoryLogger:
             }
         }
         
-        self._write_memory(initial_data)
+        # Other processes must not append to the journal this write discards
+        with self._locked():
+            self._pending = []
+            self._write_memory(initial_data)
         typer.echo("SYLVA memory has been cleared. The container is ready for new symbolic exchanges.")
         return True
     
@@ -366,16 +763,16 @@ class MemoryLogger:
             # Ensure export directory exists
             export_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Add export metadata
-            memory_data["export_metadata"] = {
+            # Add export metadata to a copy; the loaded data is the live log
+            export_data = {key: value for key, value in memory_data.items() if key != "journal_id"}
+            export_data["export_metadata"] = {
                 "exported_at": datetime.now().isoformat(),
                 "total_interactions": len(memory_data.get("interactions", [])),
                 "subsystem_activity": memory_data.get("subsystem_activity", {}),
                 "export_note": "SYLVA symbolic interaction memory export"
             }
             
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(memory_data, f, indent=2, ensure_ascii=False)
+            write_json(export_file, export_data)
             
             typer.echo(f"Memory exported to: {export_file}")
             typer.echo("The sacred record has been preserved.")
@@ -395,15 +792,13 @@ class MemoryLogger:
         """
         memory_data = self._read_memory()
         interactions = memory_data.get("interactions", [])
-        activity = memory_data.get("subsystem_activity", {})
+        activity = dict(memory_data.get("subsystem_activity", {}))
         
         total_interactions = len(interactions)
         
-        # Calculate session distribution
-        sessions = {}
-        for interaction in interactions:
-            session_id = interaction.get("session_id", "unknown")
-            sessions[session_id] = sessions.get(session_id, 0) + 1
+        # Session distribution is counted once, then kept current as interactions are logged
+        if self._session_counts is None:
+            self._session_counts = Counter(interaction.get("session_id", "unknown") for interaction in interactions)
         
         # Find most active subsystem
         most_active_subsystem = "NONE"
@@ -412,10 +807,12 @@ class MemoryLogger:
         
         return {
             "total_interactions": total_interactions,
-            "unique_sessions": len(sessions),
+            "unique_sessions": len(self._session_counts),
             "subsystem_activity": activity,
             "most_active_subsystem": most_active_subsystem,
-            "memory_file_size": self.memory_file.stat().st_size if self.memory_file.exists() else 0,
+            "memory_file_size": sum(
+                path.stat().st_size for path in (self.memory_file, self.journal_file) if path and path.exists()
+            ),
             "created_date": memory_data.get("metadata", {}).get("created", "unknown"),
             "version": memory_data.get("metadata", {}).get("version", "1.0")
         } 
\ No newline at end of file
@@ -8,11 +8,78 @@ Subsystems: MARROW (deep core), ROOT (grounding), AURA (protective boundary)
 """
 
 import random
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
+from .json_io import read_json
+from .keyword_matcher import KeywordAutomaton
+
+# Bundled metaphor data shipped with SYLVA
+METAPHOR_DATA_PATH = Path(__file__).parent.parent / "data" / "sample_metaphors.json"
+
+# Subsystem order used for keyword score tuples
+SUBSYSTEM_ORDER = ("MARROW", "ROOT", "AURA")
+
+# Maximum number of distinct inputs whose detected subsystem is remembered
+SUBSYSTEM_CACHE_SIZE = 512
+
+# Preferred archetypes for each subsystem, in the order they are offered
+SUBSYSTEM_ARCHETYPES = {
+    "MARROW": ("the_ember", "the_spiral", "the_moon", "the_forest"),
+    "ROOT": ("the_mountain", "the_forest", "the_river", "the_tide"),
+    "AURA": ("the_mask", "the_tide", "the_moon", "the_river")
+}
+
+# Descriptions returned by MetaphorEngine.get_subsystem_info
+SUBSYSTEM_INFO = {
+    "MARROW": {
+        "description": "Deep core processing - essence, wounds, and transformation",
+        "focus": "Core wounds, trauma, essence, identity, profound change",
+        "approach": "Deep witnessing, holding space for core truth"
+    },
+    "ROOT": {
+        "description": "Grounding and stability - foundation, safety, basic needs",
+        "focus": "Safety, stability, grounding, basic needs, survival, trust",
+        "approach": "Providing stability, ensuring safety, grounding techniques"
+    },
+    "AURA": {
+        "description": "Protective boundary - energy, interface with world, protection",
+        "focus": "Boundaries, energy, protection, overwhelm, sensitivity",
+        "approach": "Boundary work, energy management, protective strategies"
+    }
+}
+
+# Subsystem remarks occasionally appended to a response
+SUBSYSTEM_CONTEXT = {
+    "MARROW": " The deep systems recognize this.",
+    "ROOT": " The foundation holds steady.",
+    "AURA": " The boundary honors what is needed."
+}
+
+# The three canonical ritual closures every response ends with
+CANONICAL_CLOSURES = (
+    "That's enough for now.",
+    "We'll build from that ember.",
+    "Let it be named and left."
+)
+
+@lru_cache(maxsize=4)
+def load_metaphor_file(path: str) -> Dict:
+    """
+    Parse a metaphor data file, caching the result per path.
+    
+    Engines share the parsed data, so it must be treated as read-only.
+    
+    Args:
+        path: Path to the metaphor JSON file
+        
+    Returns:
+        Parsed metaphor data
+    """
+    return read_json(path)
+
 class MetaphorEngine:
     """
     Generates symbolic responses using metaphors, archetypes, and subsystem awareness.
@@ -22,20 +89,18 @@ class MetaphorEngine:
     def __init__(self):
         """Initialize the metaphor engine with symbolic archetypes and subsystem mapping."""
         self.load_metaphor_data()
+        self.index_subsystem_metaphors()
         self.init_subsystem_mapping()
         self.init_ritual_closures()
         
     def load_metaphor_data(self):
         """Load metaphor data from JSON file."""
-        data_path = Path(__file__).parent.parent / "data" / "sample_metaphors.json"
-        
         try:
-            with open(data_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.metaphors = data.get("metaphors", {})
-                self.universal_responses = data.get("universal_responses", [])
-                self.ritual_phrases = data.get("ritual_phrases", [])
-                self.safety_responses = data.get("safety_responses", {})
+            data = load_metaphor_file(str(METAPHOR_DATA_PATH))
+            self.metaphors = data.get("metaphors", {})
+            self.universal_responses = data.get("universal_responses", [])
+            self.ritual_phrases = data.get("ritual_phrases", [])
+            self.safety_responses = data.get("safety_responses", {})
         except FileNotFoundError:
             # Fallback to hardcoded metaphors if file not found
             self.init_fallback_metaphors()
@@ -59,6 +124,19 @@ class MetaphorEngine:
         self.ritual_phrases = []
         self.safety_responses = {}
     
+    def index_subsystem_metaphors(self):
+        """
+        Resolve each subsystem's preferred archetypes against the loaded metaphors.
+        
+        A subsystem none of whose archetypes were loaded draws from every metaphor.
+        """
+        all_names = tuple(self.metaphors)
+        self._all_metaphor_names = all_names
+        self._subsystem_metaphor_names: Dict[str, Tuple[str, ...]] = {
+            subsystem: tuple(name for name in all_names if name in archetypes) or all_names
+            for subsystem, archetypes in SUBSYSTEM_ARCHETYPES.items()
+        }
+    
     def init_subsystem_mapping(self):
         """Initialize emotional keyword to subsystem mapping."""
         # MARROW - Deep core processing, trauma, core wounds, essence
@@ -111,6 +189,35 @@ class MetaphorEngine:
             "confused": {"keywords": ["confused", "lost", "directionless"], "subsystem": "ROOT"},
             "alone": {"keywords": ["alone", "lonely", "isolated"], "subsystem": "AURA"}
         }
+        
+        self.build_keyword_index()
+    
+    def build_keyword_index(self):
+        """
+        Index every subsystem and emotion keyword for single-pass detection.
+        
+        Each keyword maps to a (MARROW, ROOT, AURA) score tuple, counting one
+        point for every list it appears in, so a single scan reproduces the
+        per-list substring checks.
+        """
+        keyword_scores: Dict[str, List[int]] = {}
+        
+        def add(keywords: List[str], subsystem: str):
+            index = SUBSYSTEM_ORDER.index(subsystem)
+            for keyword in keywords:
+                keyword_scores.setdefault(keyword, [0, 0, 0])[index] += 1
+        
+        add(self.marrow_keywords, "MARROW")
+        add(self.root_keywords, "ROOT")
+        add(self.aura_keywords, "AURA")
+        for data in self.emotion_subsystem_map.values():
+            add(data["keywords"], data["subsystem"])
+        
+        self.keyword_scores: Dict[str, Tuple[int, int, int]] = {
+            keyword: tuple(scores) for keyword, scores in keyword_scores.items()
+        }
+        self.keyword_automaton = KeywordAutomaton(self.keyword_scores)
+        self._subsystem_cache: Dict[str, str] = {}
     
     def init_ritual_closures(self):
         """Initialize randomized ritual closure lines."""
@@ -142,38 +249,56 @@ class MetaphorEngine:
         Returns:
             Subsystem name (MARROW, ROOT, or AURA)
         """
-        text_lower = text.lower()
-        
-        # Check for direct keyword matches first
-        marrow_matches = sum(1 for keyword in self.marrow_keywords if keyword in text_lower)
-        root_matches = sum(1 for keyword in self.root_keywords if keyword in text_lower)
-        aura_matches = sum(1 for keyword in self.aura_keywords if keyword in text_lower)
-        
-        # Check emotion-based mapping
-        emotion_matches = {"MARROW": 0, "ROOT": 0, "AURA": 0}
-        
-        for emotion, data in self.emotion_subsystem_map.items():
-            for keyword in data["keywords"]:
-                if keyword in text_lower:
-                    emotion_matches[data["subsystem"]] += 1
-        
-        # Combine direct and emotion-based matches
-        total_scores = {
-            "MARROW": marrow_matches + emotion_matches["MARROW"],
-            "ROOT": root_matches + emotion_matches["ROOT"], 
-            "AURA": aura_matches + emotion_matches["AURA"]
-        }
+        return self.detect_subsystem_lowered(text.lower())
+    
+    def detect_subsystem_lowered(self, text_lower: str) -> str:
+        """
+        Detect the responding subsystem for text that is already lowercased.
+        
+        Args:
+            text_lower: Lowercased emotional expression
+            
+        Returns:
+            Subsystem name (MARROW, ROOT, or AURA)
+        """
+        # Repeated inputs are common within a session; detection is deterministic
+        cached = self._subsystem_cache.get(text_lower)
+        if cached is not None:
+            return cached
+        
+        subsystem = self._score_subsystem(text_lower)
+        if len(self._subsystem_cache) < SUBSYSTEM_CACHE_SIZE:
+            self._subsystem_cache[text_lower] = subsystem
+        return subsystem
+    
+    def _score_subsystem(self, text_lower: str) -> str:
+        """
+        Score lowercased text against the keyword index and pick a subsystem.
+        
+        Args:
+            text_lower: Lowercased user expression
+            
+        Returns:
+            Subsystem name (MARROW, ROOT, or AURA)
+        """
+        # One scan finds every direct and emotion keyword present
+        marrow = root = aura = 0
+        for keyword in self.keyword_automaton.find_all(text_lower):
+            marrow_score, root_score, aura_score = self.keyword_scores[keyword]
+            marrow += marrow_score
+            root += root_score
+            aura += aura_score
         
         # Return subsystem with highest score, with tie-breaking preference
-        max_score = max(total_scores.values())
+        max_score = max(marrow, root, aura)
         if max_score == 0:
             # No clear match - default to ROOT for grounding
             return "ROOT"
         
         # If tie, prefer in order: MARROW (depth), ROOT (stability), AURA (boundary)
-        if total_scores["MARROW"] == max_score:
+        if marrow == max_score:
             return "MARROW"
-        elif total_scores["ROOT"] == max_score:
+        elif root == max_score:
             return "ROOT"
         else:
             return "AURA"
@@ -189,31 +314,14 @@ class MetaphorEngine:
         Returns:
             Selected metaphor data
         """
-        # Map subsystems to preferred archetypes
-        subsystem_archetypes = {
-            "MARROW": ["the_ember", "the_spiral", "the_moon", "the_forest"],
-            "ROOT": ["the_mountain", "the_forest", "the_river", "the_tide"],
-            "AURA": ["the_mask", "the_tide", "the_moon", "the_river"]
-        }
-        
-        # Get archetypes for this subsystem
-        preferred_archetypes = subsystem_archetypes.get(subsystem, list(self.metaphors.keys()))
-        
-        # Filter available metaphors by preferred archetypes
-        available_metaphors = {
-            name: data for name, data in self.metaphors.items() 
-            if name in preferred_archetypes
-        }
-        
-        if not available_metaphors:
-            # Fallback to any available metaphor
-            available_metaphors = self.metaphors
+        # Candidates were resolved once at load, in the loaded metaphor order
+        candidates = self._subsystem_metaphor_names.get(subsystem, self._all_metaphor_names)
         
         # Select a metaphor
-        metaphor_name = random.choice(list(available_metaphors.keys()))
+        metaphor_name = random.choice(candidates)
         return {
             "name": metaphor_name,
-            "data": available_metaphors[metaphor_name]
+            "data": self.metaphors[metaphor_name]
         }
     
     def construct_subsystem_response(
@@ -241,12 +349,7 @@ class MetaphorEngine:
         
         # Add subtle subsystem context (optional, 30% chance)
         if random.random() < 0.3:
-            subsystem_context = {
-                "MARROW": " The deep systems recognize this.",
-                "ROOT": " The foundation holds steady.",
-                "AURA": " The boundary honors what is needed."
-            }
-            base_response += subsystem_context.get(subsystem, "")
+            base_response += SUBSYSTEM_CONTEXT.get(subsystem, "")
         
         return base_response
     
@@ -260,17 +363,10 @@ class MetaphorEngine:
         Returns:
             Response with guaranteed ritual closure
         """
-        # The three canonical ritual closures
-        canonical_closures = [
-            "That's enough for now.",
-            "We'll build from that ember.",
-            "Let it be named and left."
-        ]
-        
         # Check if response already ends with one of the canonical closures
         response_stripped = response.strip()
-        if not any(response_stripped.endswith(closure) for closure in canonical_closures):
-            closure = random.choice(canonical_closures)
+        if not response_stripped.endswith(CANONICAL_CLOSURES):
+            closure = random.choice(CANONICAL_CLOSURES)
             return response_stripped + " " + closure
         
         return response
@@ -311,25 +407,8 @@ class MetaphorEngine:
         Returns:
             Subsystem information dictionary
         """
-        subsystem_info = {
-            "MARROW": {
-                "description": "Deep core processing - essence, wounds, and transformation",
-                "focus": "Core wounds, trauma, essence, identity, profound change",
-                "approach": "Deep witnessing, holding space for core truth"
-            },
-            "ROOT": {
-                "description": "Grounding and stability - foundation, safety, basic needs",
-                "focus": "Safety, stability, grounding, basic needs, survival, trust",
-                "approach": "Providing stability, ensuring safety, grounding techniques"
-            },
-            "AURA": {
-                "description": "Protective boundary - energy, interface with world, protection",
-                "focus": "Boundaries, energy, protection, overwhelm, sensitivity",
-                "approach": "Boundary work, energy management, protective strategies"
-            }
-        }
-        
-        return subsystem_info.get(subsystem, {})
+        # Copied so callers cannot alter the shared table
+        return dict(SUBSYSTEM_INFO.get(subsystem, {}))
     
     def get_metaphor_info(self, metaphor_name: str) -> Optional[Dict]:
         """